@@ -0,0 +1,6 @@
+"""
+패턴 예제들의 핵심 경로에 대한 벤치마크 모음입니다.
+
+    python -m benchmarks run --output results.json
+    python -m benchmarks run --compare baseline.json
+"""
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+from typing import List, Optional
+
+from benchmarks.cases import CASES
+from benchmarks.harness import compare, measure
+from benchmarks.importtime import check as check_import_time
+
+
+def _print_result(name: str, result: dict) -> None:
+    print(f"{name:<32} {result['ops_per_sec']:>14,.0f} ops/s  "
+          f"p50 {result['p50_us']:>8.2f}us  p99 {result['p99_us']:>8.2f}us  "
+          f"{result['bytes_per_op']:>8.0f} B/op")
+
+
+def run(args: argparse.Namespace) -> int:
+    names = [name for name in CASES
+             if not args.filter or any(f in name for f in args.filter)]
+    if not names:
+        print("선택된 벤치마크가 없습니다.", file=sys.stderr)
+        return 2
+
+    results = {}
+    for name in names:
+        bench = CASES[name]
+        iterations = max(1, int(bench.iterations * args.scale))
+        results[name] = measure(bench.setup(), iterations, bench.threads)
+        _print_result(name, results[name])
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"python": platform.python_version(),
+                       "results": results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\n성능 저하가 감지되었습니다:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\n기준 결과 대비 성능 저하가 없습니다.")
+    return 0
+
+
+def importtime(args: argparse.Namespace) -> int:
+    problems = check_import_time(args.budget_us)
+    for problem in problems:
+        print(problem)
+    if not problems:
+        print(f"import examples: 예산 {args.budget_us}us 이내입니다.")
+    return 1 if problems else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="벤치마크를 실행합니다.")
+    run_parser.add_argument("-k", "--filter", action="append",
+                            help="이름에 이 문자열이 포함된 벤치마크만 실행합니다.")
+    run_parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    run_parser.add_argument("-c", "--compare", help="비교할 기준 JSON 파일")
+    run_parser.add_argument("--threshold", type=float, default=0.10,
+                            help="성능 저하로 판단할 비율 (기본값 0.10)")
+    run_parser.add_argument("--scale", type=float, default=1.0,
+                            help="반복 횟수 배율")
+    run_parser.set_defaults(handler=run)
+
+    commands.add_parser("list", help="벤치마크 목록을 출력합니다.").set_defaults(
+        handler=lambda args: print("\n".join(CASES)) or 0)
+
+    importtime_parser = commands.add_parser(
+        "importtime", help="import examples의 비용을 확인합니다.")
+    importtime_parser.add_argument("--budget-us", type=int, default=1_000,
+                                   help="허용하는 누적 import 시간 (마이크로초)")
+    importtime_parser.set_defaults(handler=importtime)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
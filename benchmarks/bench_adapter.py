@@ -0,0 +1,31 @@
+"""
+Adapter의 요청별 번역과 일괄 번역의 처리량을 비교합니다.
+
+    python -m benchmarks.bench_adapter
+"""
+
+from timeit import Timer
+
+from examples.structural_patterns.adapter import (
+    Adaptee, Adapter, translate_buffer, translate_many,
+)
+
+
+def bench_throughput(n: int = 10_000, repeat: int = 5) -> None:
+    adapter = Adapter()
+    adaptees = [Adaptee() for _ in range(n)]
+    buffer = "\n".join(a.specific_request() for a in adaptees).encode("ascii")
+
+    cases = {
+        "request (개별)": lambda: [adapter.request() for _ in range(n)],
+        "request_many": lambda: adapter.request_many(n),
+        "translate_many": lambda: translate_many(adaptees),
+        "translate_buffer": lambda: translate_buffer(buffer),
+    }
+    for name, func in cases.items():
+        best = min(Timer(func).repeat(repeat=repeat, number=1))
+        print(f"{name:>18}: {n / best:>14,.0f} 요청/초")
+
+
+if __name__ == "__main__":
+    bench_throughput()
@@ -0,0 +1,47 @@
+"""
+ProcessCommandExecutor의 처리량이 워커 수에 따라 어떻게 늘어나는지 측정합니다.
+
+    python -m benchmarks.bench_command_pool
+"""
+
+import os
+import time
+
+from examples.behavioral_patterns.command import Command
+from examples.behavioral_patterns.command_process_pool import (
+    ProcessCommandExecutor,
+)
+
+
+class CpuBoundCommand(Command):
+    def __init__(self, payload: bytes, rounds: int = 200) -> None:
+        self._payload = payload
+        self._rounds = rounds
+
+    def execute(self) -> int:
+        total = 0
+        for _ in range(self._rounds):
+            total = (total + sum(self._payload[::97])) % 1_000_003
+        return total
+
+
+def bench_scaling(commands: int = 400, payload_size: int = 256 * 1024) -> None:
+    payload = os.urandom(payload_size)
+    batch = [CpuBoundCommand(payload) for _ in range(commands)]
+    baseline = None
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ProcessCommandExecutor(workers=workers) as executor:
+            executor.map(batch[:workers])
+            start = time.perf_counter()
+            executor.map(batch)
+            elapsed = time.perf_counter() - start
+        throughput = commands / elapsed
+        baseline = baseline or throughput
+        print(f"워커 {workers:>3}개: {throughput:>10,.1f} 명령/초 "
+              f"(x{throughput / baseline:.2f})")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    bench_scaling()
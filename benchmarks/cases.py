@@ -0,0 +1,133 @@
+"""
+벤치마크 대상 경로들입니다. 각 케이스는 준비 작업을 마친 뒤 측정할 인자 없는 함수를 돌려줍니다.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Callable, Dict, NamedTuple
+
+
+class Case(NamedTuple):
+    setup: Callable[[], Callable[[], object]]
+    iterations: int
+    threads: int
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, iterations: int = 10_000, threads: int = 1):
+    def register(setup: Callable[[], Callable[[], object]]):
+        CASES[name] = Case(setup, iterations, threads)
+        return setup
+    return register
+
+
+@case("composite.operation", iterations=2_000)
+def composite_operation():
+    from examples.structural_patterns.composite import Composite, Leaf
+
+    tree = Composite()
+    for _ in range(10):
+        branch = Composite()
+        for _ in range(10):
+            branch.add(Leaf())
+        tree.add(branch)
+    return tree.operation
+
+
+@case("singleton.call", threads=8)
+def singleton_call():
+    from examples.creational_patterns.singleton_threadsafe import Singleton
+
+    return lambda: Singleton("FOO")
+
+
+@case("singleton_pool.call", threads=8)
+def singleton_pool_call():
+    from examples.creational_patterns.singleton_pool import PooledSingletonMeta
+
+    class PooledResource(metaclass=PooledSingletonMeta):
+        pool_size = 8
+
+        def __init__(self, value: str) -> None:
+            self.value = value
+
+    return lambda: PooledResource("FOO")
+
+
+@case("prototype.deepcopy", iterations=5_000)
+def prototype_deepcopy():
+    from examples.creational_patterns.prototype import (
+        SelfReferencingEntity, SomeComponent,
+    )
+
+    circular_ref = SelfReferencingEntity()
+    component = SomeComponent(23, [1, {1, 2, 3}, [1, 2, 3]], circular_ref)
+    circular_ref.set_parent(component)
+    return lambda: copy.deepcopy(component)
+
+
+@case("builder.director")
+def builder_director():
+    from examples.creational_patterns.builder import ConcreteBuilder1, Director
+
+    director = Director()
+    builder = ConcreteBuilder1()
+    director.builder = builder
+
+    def build():
+        director.build_full_featured_product()
+        return builder.product
+
+    return build
+
+
+@case("factory_method.some_operation")
+def factory_method_some_operation():
+    from examples.creational_patterns.factory_method import ConcreteCreator1
+
+    return ConcreteCreator1().some_operation
+
+
+@case("abstract_factory.create")
+def abstract_factory_create():
+    from examples.creational_patterns.abstract_factory import ConcreteFactory1
+
+    factory = ConcreteFactory1()
+    return lambda: (factory.create_product_a(), factory.create_product_b())
+
+
+@case("command.invoker")
+def command_invoker():
+    from examples.behavioral_patterns.command import (
+        ComplexCommand, Invoker, Receiver, SimpleCommand,
+    )
+
+    invoker = Invoker()
+    invoker.set_on_start(SimpleCommand("안녕하세요!"))
+    invoker.set_on_finish(ComplexCommand(Receiver(), "이메일 보내기", "보고서 저장하기"))
+    return invoker.do_something_important
+
+
+@case("template_method")
+def template_method():
+    from examples.behavioral_patterns.template_method import ConcreteClass2
+
+    return ConcreteClass2().template_method
+
+
+@case("adapter.request", iterations=50_000)
+def adapter_request():
+    from examples.structural_patterns.adapter import Adapter
+
+    return Adapter().request
+
+
+@case("adapter.request_many", iterations=1_000)
+def adapter_request_many():
+    from examples.structural_patterns.adapter import Adapter
+
+    adapter = Adapter()
+    return lambda: adapter.request_many(100)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import time
+import tracemalloc
+from threading import Barrier, Thread
+from typing import Callable, Dict, List
+
+
+class _NullWriter(io.TextIOBase):
+    """
+    예제들이 출력하는 내용을 버리는 stdout 대체 객체입니다.
+    """
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def _percentile(ordered: List[int], fraction: float) -> float:
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index] / 1_000
+
+
+def _timed_loop(func: Callable[[], object], iterations: int,
+                out: List[int]) -> None:
+    clock = time.perf_counter_ns
+    append = out.append
+    for _ in range(iterations):
+        start = clock()
+        func()
+        append(clock() - start)
+
+
+def measure(func: Callable[[], object], iterations: int = 10_000,
+            threads: int = 1, warmup: int = 100) -> Dict[str, float]:
+    """
+    func를 iterations번 (threads개의 스레드에서 각각) 호출하여 처리량, 지연 시간 백분위수(마이크로초),
+    호출당 할당량을 측정합니다. 할당량은 tracemalloc을 켠 별도의 실행에서 측정하므로
+    시간 측정에는 영향을 주지 않습니다.
+    """
+
+    with contextlib.redirect_stdout(_NullWriter()):
+        for _ in range(warmup):
+            func()
+
+        samples: List[List[int]] = [[] for _ in range(threads)]
+        if threads == 1:
+            start = time.perf_counter()
+            _timed_loop(func, iterations, samples[0])
+            elapsed = time.perf_counter() - start
+        else:
+            barrier = Barrier(threads + 1)
+
+            def worker(out: List[int]) -> None:
+                barrier.wait()
+                _timed_loop(func, iterations, out)
+
+            workers = [Thread(target=worker, args=(out,)) for out in samples]
+            for thread in workers:
+                thread.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for thread in workers:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+        alloc_iterations = max(1, min(iterations, 1_000))
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            kept = [func() for _ in range(alloc_iterations)]
+            after = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del kept
+
+    stats = after.compare_to(before, "filename")
+    allocated = sum(max(stat.size_diff, 0) for stat in stats
+                    if os.path.basename(stat.traceback[0].filename)
+                    != "tracemalloc.py")
+    ordered = sorted(sample for out in samples for sample in out)
+    total = len(ordered)
+    return {
+        "iterations": total,
+        "threads": threads,
+        "ops_per_sec": total / elapsed if elapsed else float("inf"),
+        "p50_us": _percentile(ordered, 0.50),
+        "p90_us": _percentile(ordered, 0.90),
+        "p99_us": _percentile(ordered, 0.99),
+        "max_us": ordered[-1] / 1_000,
+        "bytes_per_op": allocated / alloc_iterations,
+        "peak_bytes": peak,
+    }
+
+
+def compare(current: Dict[str, Dict[str, float]],
+            baseline: Dict[str, Dict[str, float]],
+            threshold: float = 0.10) -> List[str]:
+    """
+    기준 결과와 비교하여 처리량이 threshold 비율 이상 줄었거나 p99 지연 시간이나
+    호출당 할당량이 threshold 비율 이상 늘어난 벤치마크를 찾아 설명 문자열 목록으로 돌려줍니다.
+    """
+
+    regressions = []
+    for name, result in current.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append(
+                f"{name}: 처리량 {base['ops_per_sec']:,.0f} -> "
+                f"{result['ops_per_sec']:,.0f} ops/s")
+        if result["p99_us"] > base["p99_us"] * (1 + threshold):
+            regressions.append(
+                f"{name}: p99 {base['p99_us']:.2f} -> {result['p99_us']:.2f} us")
+        if result["bytes_per_op"] > base["bytes_per_op"] * (1 + threshold) + 1:
+            regressions.append(
+                f"{name}: 할당 {base['bytes_per_op']:.0f} -> "
+                f"{result['bytes_per_op']:.0f} B/op")
+    return regressions
@@ -0,0 +1,62 @@
+"""
+`python -X importtime`으로 `import examples`의 비용을 측정하고, 하위 모듈이 미리 불러와지지 않는지 확인합니다.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(module: str = "examples") -> Tuple[Dict[str, int], List[str]]:
+    """
+    새 인터프리터에서 module을 불러오고 `-X importtime` 출력에서 모듈별 누적 시간(마이크로초)과
+    불러와진 examples 모듈 목록을 돌려줍니다.
+    """
+
+    code = (f"import {module}, sys; "
+            "print('\\n'.join(m for m in sys.modules if m.startswith('examples')))")
+    # 바이트코드 캐시가 없으면 컴파일 시간까지 측정되므로 캐시 쓰기를 허용합니다.
+    env = {key: value for key, value in os.environ.items()
+           if key != "PYTHONDONTWRITEBYTECODE"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=_ROOT, env=env, capture_output=True, text=True, check=True)
+
+    cumulative: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in
+                                  line[len("import time:"):].split("|"))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return cumulative, completed.stdout.split()
+
+
+def check(budget_us: int = 1_000, repeat: int = 5) -> List[str]:
+    """
+    `import examples`의 누적 시간이 budget_us를 넘거나 패턴 모듈이 함께 불러와지면
+    문제를 설명하는 문자열 목록을 돌려줍니다. 측정값은 repeat번 중 가장 작은 값을 사용합니다.
+    """
+
+    problems = []
+    best = None
+    for _ in range(repeat):
+        cumulative, loaded = import_times()
+        took = cumulative.get("examples")
+        if took is not None and (best is None or took < best):
+            best = took
+        eager = [name for name in loaded if name != "examples"]
+        if eager:
+            problems.append(f"import examples가 하위 모듈을 불러왔습니다: {eager}")
+            break
+    if best is None:
+        problems.append("importtime 출력에서 examples를 찾지 못했습니다.")
+    elif best > budget_us:
+        problems.append(f"import examples: {best}us (예산 {budget_us}us)")
+    return problems
@@ -0,0 +1,58 @@
+"""
+디자인 패턴 예제 모음입니다.
+
+자주 쓰는 클래스는 패키지에서 바로 가져올 수 있습니다. 실제 모듈은 이름을 처음 사용할 때만 불러오므로
+`import examples` 자체는 하위 모듈을 하나도 불러오지 않습니다.
+
+    from examples import Composite, SingletonMeta
+"""
+
+_SUBPACKAGES = (
+    "behavioral_patterns",
+    "creational_patterns",
+    "structural_patterns",
+)
+
+_EXPORTS = {
+    # creational_patterns
+    "AbstractFactory": "creational_patterns",
+    "Builder": "creational_patterns",
+    "ConcreteBuilder1": "creational_patterns",
+    "Director": "creational_patterns",
+    "Creator": "creational_patterns",
+    "SomeComponent": "creational_patterns",
+    "SingletonMeta": "creational_patterns",
+    "Singleton": "creational_patterns",
+    # structural_patterns
+    "Target": "structural_patterns",
+    "Adapter": "structural_patterns",
+    "Abstraction": "structural_patterns",
+    "Implementation": "structural_patterns",
+    "Component": "structural_patterns",
+    "Leaf": "structural_patterns",
+    "Composite": "structural_patterns",
+    # behavioral_patterns
+    "Command": "behavioral_patterns",
+    "Invoker": "behavioral_patterns",
+    "Receiver": "behavioral_patterns",
+    "AbstractClass": "behavioral_patterns",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    from importlib import import_module
+
+    if name in _SUBPACKAGES or name == "instrumentation":
+        return import_module(f".{name}", __name__)
+    subpackage = _EXPORTS.get(name)
+    if subpackage is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{subpackage}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
@@ -0,0 +1,38 @@
+"""
+행위 패턴 예제들입니다. 아래의 이름들은 처음 사용할 때 해당 모듈을 불러옵니다.
+"""
+
+_EXPORTS = {
+    "Command": "command",
+    "SimpleCommand": "command",
+    "ComplexCommand": "command",
+    "Receiver": "command",
+    "Invoker": "command",
+    "ReversibleCommand": "command_history",
+    "StateDelta": "command_history",
+    "CommandHistory": "command_history",
+    "CommandScheduler": "command_scheduler",
+    "ProcessCommandExecutor": "command_process_pool",
+    "AbstractClass": "template_method",
+    "ConcreteClass1": "template_method",
+    "ConcreteClass2": "template_method",
+    "batch_client_code": "template_method",
+    "AsyncAbstractClass": "template_method_async",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    from importlib import import_module
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
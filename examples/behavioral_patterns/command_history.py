@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, List, Mapping, MutableMapping
+
+from examples.behavioral_patterns.command import Command
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+"""
+StateDelta에서 "키가 없음"을 나타내는 값입니다. 새 값으로 쓰면 해당 키를 삭제합니다.
+"""
+
+
+class ReversibleCommand(Command):
+    """
+    되돌릴 수 있는 명령의 인터페이스입니다.
+    """
+
+    @abstractmethod
+    def undo(self) -> None:
+        pass
+
+    def absorb(self, newer: ReversibleCommand) -> bool:
+        """
+        바로 다음에 실행된 명령 newer를 이 명령에 합쳐 하나의 체크포인트로 만들 수 있으면 합치고 True를 돌려줍니다.
+        합친 뒤에는 이 명령의 undo가 두 명령을 모두 되돌려야 합니다. 기본 구현은 합치지 않습니다.
+        """
+
+        return False
+
+
+class StateDelta(ReversibleCommand):
+    """
+    StateDelta는 수신기의 상태(MutableMapping)에 변경 사항을 적용합니다.
+    상태 전체를 복사하는 대신 변경되는 키의 이전 값만 기억하므로, 상태가 커도 명령 하나의 크기는
+    변경한 키의 수에 비례합니다. 일반 객체는 `vars(receiver)`를 상태로 넘기면 됩니다.
+    """
+
+    def __init__(self, state: MutableMapping, changes: Mapping[Hashable, Any]) -> None:
+        self._state = state
+        self._changes: Dict[Hashable, Any] = dict(changes)
+        self._previous: Dict[Hashable, Any] = {}
+
+    def execute(self) -> None:
+        state = self._state
+        self._previous = {key: state.get(key, MISSING) for key in self._changes}
+        self._apply(self._changes)
+
+    def undo(self) -> None:
+        self._apply(self._previous)
+
+    def _apply(self, values: Mapping[Hashable, Any]) -> None:
+        state = self._state
+        for key, value in values.items():
+            if value is MISSING:
+                state.pop(key, None)
+            else:
+                state[key] = value
+
+    def absorb(self, newer: ReversibleCommand) -> bool:
+        """
+        같은 상태에 대한 두 델타는 하나로 합칠 수 있습니다. 새 값은 나중 명령의 값을,
+        이전 값은 먼저 실행된 명령의 값을 사용합니다.
+        """
+
+        if not isinstance(newer, StateDelta) or newer._state is not self._state:
+            return False
+        self._changes.update(newer._changes)
+        for key, value in newer._previous.items():
+            self._previous.setdefault(key, value)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._changes)
+
+
+class CommandHistory:
+    """
+    CommandHistory는 실행된 명령의 실행 취소/다시 실행 스택을 관리합니다.
+
+    실행 취소 스택은 max_undo개의 항목으로 제한됩니다. 한도를 넘으면 가장 오래된 항목이 다음 항목을
+    흡수하여 체크포인트가 됩니다. 최근 명령은 하나씩 되돌릴 수 있고, 오래된 기록은 체크포인트 한 번으로
+    되돌아갑니다. 그래서 수백만 단계의 기록도 제한된 메모리 안에 들어갑니다.
+    합칠 수 없는 명령은 한도를 넘으면 버려집니다.
+    """
+
+    def __init__(self, max_undo: int = 1_000) -> None:
+        if max_undo < 1:
+            raise ValueError("max_undo는 1 이상이어야 합니다.")
+        self._max_undo = max_undo
+        self._undo: Deque[ReversibleCommand] = deque()
+        self._redo: List[ReversibleCommand] = []
+
+    def execute(self, command: ReversibleCommand) -> None:
+        command.execute()
+        self._undo.append(command)
+        self._redo.clear()
+        self._compact()
+
+    def undo(self) -> bool:
+        if not self._undo:
+            return False
+        command = self._undo.pop()
+        command.undo()
+        self._redo.append(command)
+        return True
+
+    def redo(self) -> bool:
+        if not self._redo:
+            return False
+        command = self._redo.pop()
+        command.execute()
+        self._undo.append(command)
+        return True
+
+    def _compact(self) -> None:
+        undo = self._undo
+        while len(undo) > self._max_undo:
+            oldest = undo.popleft()
+            if oldest.absorb(undo[0]):
+                undo[0] = oldest
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+
+if __name__ == "__main__":
+    """
+    python -m examples.behavioral_patterns.command_history
+    """
+
+    document = {"title": "초안", "body": ""}
+    history = CommandHistory(max_undo=3)
+
+    for step in range(1, 100_001):
+        history.execute(StateDelta(document, {"body": f"{step}번째 수정"}))
+    history.execute(StateDelta(document, {"title": "완성본"}))
+
+    print(f"십만 번 수정한 뒤의 문서: {document}")
+    print(f"실행 취소 스택의 크기: {len(history)}")
+
+    history.undo()
+    print(f"한 번 실행 취소: {document}")
+
+    while history.undo():
+        pass
+    print(f"모두 실행 취소: {document}")
+
+    history.redo()
+    print(f"다시 실행: {document}")
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import copy
+import itertools
+import os
+import pickle
+import weakref
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from examples.behavioral_patterns.command import (
+    Command, ComplexCommand, Receiver, SimpleCommand,
+)
+
+_worker_receivers: Dict[int, Any] = {}
+"""
+워커 프로세스에 머무르는 수신기들입니다. 같은 수신기로 가는 명령은 항상 같은 워커로 가므로,
+수신기는 첫 명령과 함께 한 번만 전달되고, 이후 명령은 키로 이 수신기를 찾아 사용합니다.
+따라서 수신기의 상태가 워커 안에 유지됩니다.
+"""
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # 부모 프로세스가 공유 메모리의 수명을 관리하므로 워커에서는 리소스 추적을 하지 않습니다.
+    # track 인자가 없는 Python 3.13 미만에서는 워커도 부모와 같은 리소스 추적기를 쓰므로
+    # 중복 등록은 무시되고, 부모가 unlink할 때 등록이 해제됩니다.
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _release_receivers(keys: Iterable[int]) -> None:
+    """
+    워커 프로세스에서 실행됩니다. 더 이상 쓰이지 않는 수신기를 놓아줍니다.
+    """
+
+    for key in keys:
+        _worker_receivers.pop(key, None)
+
+
+def _run_command(receiver_key: Optional[int], blob: Optional[bytes],
+                 handle: Optional[Tuple[str, int]], released: Tuple[int, ...]) -> Any:
+    """
+    워커 프로세스에서 실행됩니다. 큰 명령은 공유 메모리 핸들(이름, 크기)로 전달받습니다.
+    blob은 (수신기, 수신기를 뺀 명령)을 직렬화한 것이며, 수신기는 그 키로 처음 보낼 때만 들어 있습니다.
+    """
+
+    _release_receivers(released)
+    if handle is not None:
+        name, size = handle
+        segment = _attach(name)
+        try:
+            receiver, command = pickle.loads(segment.buf[:size])
+        finally:
+            segment.close()
+    else:
+        receiver, command = pickle.loads(blob)
+
+    if receiver_key is not None:
+        if receiver is not None:
+            _worker_receivers[receiver_key] = receiver
+        command._receiver = _worker_receivers[receiver_key]
+    return command.execute()
+
+
+class _Registration:
+    """
+    실행기가 기억하는 수신기 하나입니다. sent는 수신기가 워커에 전달되었는지를 나타냅니다.
+    """
+
+    __slots__ = ("key", "ref", "sent")
+
+    def __init__(self, key: int, ref: Callable[[], Any]) -> None:
+        self.key = key
+        self.ref = ref
+        self.sent = False
+
+
+class ProcessCommandExecutor:
+    """
+    Command 객체를 여러 프로세스에서 실행합니다. CPU를 많이 쓰는 수신기를 위한 실행기입니다.
+
+    워커마다 하나의 프로세스가 있으며, 같은 Receiver를 가진 명령은 항상 같은 워커로 보내집니다.
+    따라서 수신기의 상태는 그 워커 안에 머뭅니다. 수신기가 없는 명령은 워커들에 차례로 분배됩니다.
+
+    수신기는 명령과 따로 직렬화되어 그 워커로 처음 갈 때 한 번만 전달됩니다. 실행기는 수신기를 약한 참조로만
+    기억하며, 수신기가 사라지면 다음에 그 워커로 가는 호출에서 워커 쪽 수신기도 정리됩니다.
+    release_receiver()로 즉시 놓아줄 수도 있습니다.
+
+    직렬화된 명령이 shm_threshold 바이트 이상이면 multiprocessing.shared_memory에 담고
+    워커에는 핸들만 전달합니다. 공유 메모리는 명령이 끝나면 부모 프로세스에서 해제됩니다.
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 shm_threshold: int = 64 * 1024) -> None:
+        from multiprocessing import resource_tracker
+
+        # 워커를 만들기 전에 리소스 추적기를 띄워 두어야 워커들이 부모와 같은 추적기를 공유합니다.
+        resource_tracker.ensure_running()
+        count = workers or os.cpu_count() or 1
+        self._shards: List[ProcessPoolExecutor] = [
+            ProcessPoolExecutor(max_workers=1) for _ in range(count)]
+        self._shm_threshold = shm_threshold
+        self._round_robin = itertools.cycle(range(count))
+        self._receiver_keys: Dict[int, _Registration] = {}
+        self._receivers_lock = Lock()
+        self._next_key = itertools.count()
+        # 사라진 수신기의 키를 워커별로 모아 두었다가 다음 호출에 함께 보냅니다.
+        self._released: List[Deque[int]] = [deque() for _ in range(count)]
+
+    def _register(self, receiver: Any) -> _Registration:
+        """
+        수신기마다 고유한 키를 부여합니다. self._receivers_lock을 잡은 상태에서 호출됩니다.
+        수신기는 약한 참조로 기억하므로 실행기가 수신기의 수명을 늘리지 않습니다.
+        """
+
+        known = self._receiver_keys.get(id(receiver))
+        if known is not None and known.ref() is receiver:
+            return known
+
+        key = next(self._next_key)
+        registry, released = self._receiver_keys, self._released[key % len(self._shards)]
+        receiver_id = id(receiver)
+
+        def forget(_: Any) -> None:
+            # 가비지 컬렉션 도중에도 호출될 수 있으므로 잠금을 잡는 작업은 하지 않습니다.
+            known = registry.get(receiver_id)
+            if known is not None and known.key == key:
+                del registry[receiver_id]
+            released.append(key)
+
+        try:
+            ref: Callable[[], Any] = weakref.ref(receiver, forget)
+        except TypeError:
+            # 약한 참조를 지원하지 않는 수신기는 release_receiver()를 호출할 때까지 보관합니다.
+            ref = lambda: receiver  # noqa: E731
+        registration = self._receiver_keys[receiver_id] = _Registration(key, ref)
+        return registration
+
+    def release_receiver(self, receiver: Any) -> None:
+        """
+        수신기를 실행기와 워커에서 놓아줍니다. 이후 같은 수신기로 명령을 보내면 새로 전달됩니다.
+        """
+
+        with self._receivers_lock:
+            known = self._receiver_keys.get(id(receiver))
+            if known is None or known.ref() is not receiver:
+                return
+            del self._receiver_keys[id(receiver)]
+            self._shards[known.key % len(self._shards)].submit(
+                _release_receivers, (known.key,))
+
+    def _drain_released(self, index: int) -> Tuple[int, ...]:
+        released = self._released[index]
+        keys = []
+        while released:
+            keys.append(released.popleft())
+        return tuple(keys)
+
+    def submit(self, command: Command) -> Future:
+        receiver = getattr(command, "_receiver", None)
+        if receiver is None:
+            return self._send(next(self._round_robin), None, (None, command))
+
+        command = copy.copy(command)
+        command._receiver = None
+        with self._receivers_lock:
+            registration = self._register(receiver)
+            index = registration.key % len(self._shards)
+            if not registration.sent:
+                # 수신기를 싣는 첫 명령은 잠금을 잡은 채 제출합니다. 그래야 다른 스레드가 보낸 같은
+                # 수신기의 명령이 이 명령보다 먼저 워커에 도착하지 않습니다. 제출에 실패하면 sent가
+                # 그대로 거짓이므로 다음 명령이 수신기를 다시 싣습니다.
+                future = self._send(index, registration.key, (receiver, command))
+                registration.sent = True
+                return future
+        return self._send(index, registration.key, (None, command))
+
+    def _send(self, index: int, receiver_key: Optional[int],
+              payload: Tuple[Any, Command]) -> Future:
+        shard = self._shards[index]
+        released = self._drain_released(index)
+        try:
+            return self._submit_blob(shard, receiver_key, payload, released)
+        except BaseException:
+            # 전달하지 못한 정리 요청은 다음 호출에 다시 싣습니다.
+            self._released[index].extend(released)
+            raise
+
+    def _submit_blob(self, shard: ProcessPoolExecutor, receiver_key: Optional[int],
+                     payload: Tuple[Any, Command], released: Tuple[int, ...]) -> Future:
+        blob = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(blob) < self._shm_threshold:
+            return shard.submit(_run_command, receiver_key, blob, None, released)
+
+        segment = shared_memory.SharedMemory(create=True, size=len(blob))
+        segment.buf[:len(blob)] = blob
+        del blob
+        try:
+            future = shard.submit(_run_command, receiver_key, None,
+                                  (segment.name, segment.size), released)
+        except BaseException:
+            segment.close()
+            segment.unlink()
+            raise
+
+        def release(_: Future) -> None:
+            segment.close()
+            segment.unlink()
+
+        future.add_done_callback(release)
+        return future
+
+    def map(self, commands: List[Command]) -> List[Any]:
+        futures = [self.submit(command) for command in commands]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        for shard in self._shards:
+            shard.shutdown(wait=wait)
+        with self._receivers_lock:
+            self._receiver_keys.clear()
+
+    def __enter__(self) -> ProcessCommandExecutor:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+if __name__ == "__main__":
+    """
+    python -m examples.behavioral_patterns.command_process_pool
+    """
+
+    receiver = Receiver()
+    with ProcessCommandExecutor(workers=2, shm_threshold=1024) as executor:
+        executor.map([
+            SimpleCommand("작은 페이로드"),
+            SimpleCommand("큰 페이로드 " + "x" * 2048),
+            ComplexCommand(receiver, "이메일 보내기", "보고서 저장하기"),
+            ComplexCommand(receiver, "다시 보내기", "다시 저장하기"),
+        ])
+    print()
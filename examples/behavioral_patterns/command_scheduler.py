@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import heapq
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from examples.behavioral_patterns.command import Command, SimpleCommand
+
+
+class TimerWheel:
+    """
+    해시 타이머 휠입니다. 지연 실행할 항목을 `tick`초 단위의 칸에 나누어 담고, 시간이 흐른 칸만 확인합니다.
+    항목을 넣고 꺼내는 비용은 대기 중인 전체 항목 수와 관계없이 일정합니다.
+    """
+
+    def __init__(self, now: float, tick: float = 0.01, slots: int = 512) -> None:
+        self._tick = tick
+        self._slots: List[List[Tuple[int, object]]] = [[] for _ in range(slots)]
+        self._current = int(now / tick)
+        self._count = 0
+
+    def schedule(self, when: float, item: object) -> None:
+        due = max(int(when / self._tick), self._current)
+        self._slots[due % len(self._slots)].append((due, item))
+        self._count += 1
+
+    def advance(self, now: float) -> List[object]:
+        """
+        now까지 만기가 된 항목들을 꺼내 돌려줍니다.
+        """
+
+        target = int(now / self._tick)
+        if target < self._current or not self._count:
+            self._current = max(self._current, target)
+            return []
+
+        slots = self._slots
+        span = min(target - self._current + 1, len(slots))
+        expired: List[object] = []
+        for offset in range(span):
+            index = (self._current + offset) % len(slots)
+            bucket = slots[index]
+            if not bucket:
+                continue
+            remaining = [entry for entry in bucket if entry[0] > target]
+            if len(remaining) != len(bucket):
+                expired.extend(item for due, item in bucket if due <= target)
+                slots[index] = remaining
+        self._current = target
+        self._count -= len(expired)
+        return expired
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[object]:
+        for bucket in self._slots:
+            for _, item in bucket:
+                yield item
+
+
+class CommandScheduler:
+    """
+    CommandScheduler는 Command 객체를 우선순위, 마감 시간, 처리율 제한에 따라 실행합니다.
+
+    실행 준비가 된 명령은 (우선순위, 마감 시간, 제출 순서)로 정렬되는 힙에 보관되며, 숫자가 작을수록 먼저 실행됩니다.
+    지연 실행할 명령은 만기가 될 때까지 타이머 휠에서 기다립니다.
+
+    과부하 상태에서는 마감 시간을 넘긴 명령을 늦게 실행하는 대신 버립니다. 처리율 제한이 있으면,
+    제출 시점에 자신보다 먼저 실행될 명령(우선순위와 마감 시간 순으로 앞서는 명령) 수로 보아
+    마감 시간 안에 시작할 수 없는 명령은 큐에 넣지 않고 바로 버립니다. 이 판단을 위해 우선순위마다
+    대기 중인 명령의 마감 시간을 정렬된 목록으로 유지하므로, 대기열이 길어도 이진 탐색 몇 번으로 끝납니다.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1,
+                 clock: Callable[[], float] = time.monotonic,
+                 tick: float = 0.01) -> None:
+        self._clock = clock
+        self._ready: List[Tuple[int, float, int, float, Command]] = []
+        self._wheel = TimerWheel(clock(), tick)
+        self._seq = 0
+        # 우선순위 -> 정렬된 마감 시간 목록. 실행 준비가 된 명령과 지연된 명령을 따로 보관합니다.
+        self._ready_expiries: Dict[int, List[float]] = {}
+        self._delayed_expiries: Dict[int, List[float]] = {}
+
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled = clock()
+
+        self.executed = 0
+        self.dropped = 0
+        self.shed = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+
+    def submit(self, command: Command, priority: int = 0, delay: float = 0.0,
+               deadline: Optional[float] = None) -> bool:
+        """
+        명령을 예약합니다. delay초 뒤에 실행 준비가 되며, deadline이 주어지면 제출 후 deadline초 안에
+        시작되지 않은 명령은 실행되지 않습니다. 제출 즉시 버려진 경우 False를 돌려줍니다.
+        """
+
+        now = self._clock()
+        expires = now + deadline if deadline is not None else float("inf")
+        if self._rate is not None and deadline is not None:
+            backlog = len(self._ready) + len(self._wheel)
+            if (now + delay + backlog / self._rate > expires
+                    and now + delay + self._ahead(priority, expires, now, now + delay)
+                    / self._rate > expires):
+                self.shed += 1
+                return False
+
+        self._seq += 1
+        entry = (priority, expires, self._seq, now + delay, command)
+        if delay > 0:
+            self._wheel.schedule(now + delay, entry)
+            insort(self._delayed_expiries.setdefault(priority, []), expires)
+        else:
+            heapq.heappush(self._ready, entry)
+            insort(self._ready_expiries.setdefault(priority, []), expires)
+        return True
+
+    @staticmethod
+    def _count_ahead(expiries: Dict[int, List[float]], priority: int,
+                     expires: float, now: float) -> int:
+        # 이미 마감 시간이 지난 명령은 실행되지 않고 버려지므로 세지 않습니다.
+        ahead = 0
+        for other, times in expiries.items():
+            if other < priority:
+                ahead += len(times) - bisect_left(times, now)
+            elif other == priority:
+                ahead += bisect_right(times, expires) - bisect_left(times, now)
+        return ahead
+
+    def _ahead(self, priority: int, expires: float, now: float,
+               eligible: float) -> int:
+        """
+        eligible 시점에 (priority, expires) 명령보다 먼저 실행될 대기 명령 수를 셉니다.
+        키가 같으면 먼저 제출된 명령이 앞섭니다.
+
+        지연된 명령은 eligible 이전에 실행 준비가 되는 것만 앞선다고 봅니다. 이는 실행 준비 시각을 무시한
+        상한과 실행 준비가 된 명령만 센 하한으로 결정되지 않을 때만 타이머 휠을 훑어 셉니다.
+        """
+
+        ahead = self._count_ahead(self._ready_expiries, priority, expires, now)
+        delayed = self._count_ahead(self._delayed_expiries, priority, expires, now)
+        slack = (expires - eligible) * self._rate
+        if ahead > slack or ahead + delayed <= slack:
+            return ahead + delayed
+        key = (priority, expires)
+        return ahead + sum(1 for entry in self._wheel
+                           if entry[3] <= eligible and now <= entry[1]
+                           and entry[:2] <= key)
+
+    @staticmethod
+    def _forget(expiries: Dict[int, List[float]], priority: int,
+                expires: float) -> None:
+        times = expiries[priority]
+        del times[bisect_left(times, expires)]
+        if not times:
+            del expiries[priority]
+
+    def _take_token(self, now: float) -> bool:
+        if self._rate is None:
+            return True
+        self._tokens = min(self._burst,
+                           self._tokens + (now - self._refilled) * self._rate)
+        self._refilled = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def run_pending(self, limit: Optional[int] = None) -> int:
+        """
+        지금 실행할 수 있는 명령을 실행하고 실행한 명령 수를 돌려줍니다.
+        처리율 제한에 걸리거나 limit개를 실행하면 멈춥니다.
+        """
+
+        now = self._clock()
+        for entry in self._wheel.advance(now):
+            heapq.heappush(self._ready, entry)
+            self._forget(self._delayed_expiries, entry[0], entry[1])
+            insort(self._ready_expiries.setdefault(entry[0], []), entry[1])
+
+        ready = self._ready
+        count = 0
+        while ready and (limit is None or count < limit):
+            priority, expires, _, eligible, command = ready[0]
+            if expires < now:
+                heapq.heappop(ready)
+                self._forget(self._ready_expiries, priority, expires)
+                self.dropped += 1
+                continue
+            if not self._take_token(now):
+                break
+            heapq.heappop(ready)
+            self._forget(self._ready_expiries, priority, expires)
+
+            lag = now - eligible
+            self._lag_total += lag
+            self._lag_max = max(self._lag_max, lag)
+            command.execute()
+            self.executed += 1
+            count += 1
+            now = self._clock()
+        return count
+
+    def run_until_idle(self, poll: float = 0.001) -> None:
+        """
+        대기 중인 명령이 모두 실행되거나 버려질 때까지 실행합니다.
+        """
+
+        while self._ready or len(self._wheel):
+            if not self.run_pending():
+                time.sleep(poll)
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            "queue_depth": len(self._ready),
+            "delayed": len(self._wheel),
+            "executed": self.executed,
+            "dropped": self.dropped,
+            "shed": self.shed,
+            "avg_lag": self._lag_total / self.executed if self.executed else 0.0,
+            "max_lag": self._lag_max,
+        }
+
+
+if __name__ == "__main__":
+    """
+    python -m examples.behavioral_patterns.command_scheduler
+    """
+
+    scheduler = CommandScheduler(rate=200, burst=5)
+    scheduler.submit(SimpleCommand("나중에"), delay=0.05)
+    scheduler.submit(SimpleCommand("보통"), priority=5)
+    scheduler.submit(SimpleCommand("긴급"), priority=0)
+    for index in range(100):
+        scheduler.submit(SimpleCommand(f"일괄 {index}"), priority=9, deadline=0.1)
+
+    scheduler.run_until_idle()
+    print(scheduler.metrics())
@@ -1,4 +1,22 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, wait
+from typing import Dict, Iterable, List, Optional, Type
+
+
+TEMPLATE_STEPS = (
+    "base_operation1",
+    "required_operations1",
+    "base_operation2",
+    "hook1",
+    "required_operations2",
+    "base_operation3",
+    "hook2",
+)
+"""
+template_method가 호출하는 단계의 순서입니다. 배치 실행기는 이 순서대로 단계별 실행을 진행합니다.
+"""
 
 
 class AbstractClass(ABC):
@@ -13,13 +31,8 @@ class AbstractClass(ABC):
         템플릿 메서드는 알고리즘의 뼈대를 정의합니다.
         """
 
-        self.base_operation1()
-        self.required_operations1()
-        self.base_operation2()
-        self.hook1()
-        self.required_operations2()
-        self.base_operation3()
-        self.hook2()
+        for step in TEMPLATE_STEPS:
+            getattr(self, step)()
 
     # 이러한 작업에는 이미 구현이 있습니다.
 
@@ -90,6 +103,75 @@ def client_code(abstract_class: AbstractClass) -> None:
     # ...
 
 
+def group_by_class(
+    abstract_classes: Iterable[AbstractClass],
+) -> Dict[Type[AbstractClass], List[AbstractClass]]:
+    """
+    객체들을 구체 클래스별로 묶습니다. 처음 등장한 순서가 유지됩니다.
+    """
+
+    groups: Dict[Type[AbstractClass], List[AbstractClass]] = {}
+    for abstract_class in abstract_classes:
+        groups.setdefault(type(abstract_class), []).append(abstract_class)
+    return groups
+
+
+def _run_step(cls: Type[AbstractClass], step: str,
+              group: List[AbstractClass]) -> None:
+    """
+    구체 클래스가 `<단계>_batch` 클래스 메서드를 제공하면 그룹 전체를 한 번에 넘기고 (벡터화),
+    그렇지 않으면 객체마다 단계를 호출합니다.
+    """
+
+    batch = getattr(cls, f"{step}_batch", None)
+    if batch is not None:
+        batch(group)
+        return
+    for abstract_class in group:
+        getattr(abstract_class, step)()
+
+
+def batch_client_code(abstract_classes: Iterable[AbstractClass],
+                      executor: Optional[Executor] = None) -> None:
+    """
+    여러 객체에 대해 템플릿을 객체 단위가 아니라 단계 단위로 실행합니다.
+    모든 객체의 base_operation1이 끝난 뒤에 required_operations1로 넘어가는 식입니다.
+
+    객체는 구체 클래스별로 묶이며, executor가 주어지면 각 단계에서 그룹마다 하나의 작업으로 제출됩니다.
+    다음 단계는 이전 단계의 모든 그룹이 끝난 뒤에 시작되므로 단계 간의 순서는 유지됩니다.
+    template_method를 오버라이드한 클래스의 객체는 단계별로 나눌 수 없으므로, 단계별 실행이 끝난 뒤
+    각자의 template_method로 실행됩니다.
+    """
+
+    groups = group_by_class(abstract_classes)
+    custom = {cls: groups.pop(cls) for cls in list(groups)
+              if cls.template_method is not AbstractClass.template_method}
+    for step in TEMPLATE_STEPS:
+        if executor is None:
+            for cls, group in groups.items():
+                _run_step(cls, step, group)
+        else:
+            futures = [executor.submit(_run_step, cls, step, group)
+                       for cls, group in groups.items()]
+            wait(futures)
+            for future in futures:
+                future.result()
+
+    if executor is None:
+        for group in custom.values():
+            _run_templates(group)
+    else:
+        futures = [executor.submit(_run_templates, group) for group in custom.values()]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+
+def _run_templates(group: List[AbstractClass]) -> None:
+    for abstract_class in group:
+        abstract_class.template_method()
+
+
 if __name__ == "__main__":
     print("동일한 클라이언트 코드는 다른 하위 클래스와 함께 작동할 수 있습니다:")
     client_code(ConcreteClass1())
@@ -97,3 +179,7 @@ if __name__ == "__main__":
 
     print("동일한 클라이언트 코드는 다른 하위 클래스와 함께 작동할 수 있습니다:")
     client_code(ConcreteClass2())
+    print("")
+
+    print("배치 실행기는 여러 객체를 단계별로 실행합니다:")
+    batch_client_code([ConcreteClass1(), ConcreteClass2(), ConcreteClass1()])
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import FrozenSet, List, Tuple
+
+from examples.behavioral_patterns.template_method import TEMPLATE_STEPS
+
+
+class AsyncAbstractClass(ABC):
+    """
+    AbstractClass의 asyncio 버전입니다. 템플릿 메서드는 각 단계를 await 합니다.
+
+    하위 클래스는 `independent_steps`에 서로 독립적인 단계를 선언할 수 있습니다.
+    두 base_operation 사이에 놓인 단계 중 독립적으로 선언된 단계들은 asyncio.gather로 동시에 실행되고,
+    base_operation 단계들 사이의 순서는 항상 유지됩니다.
+    """
+
+    independent_steps: FrozenSet[str] = frozenset()
+
+    async def template_method(self) -> None:
+        """
+        템플릿 메서드는 알고리즘의 뼈대를 정의합니다.
+        """
+
+        for stage in self._stages():
+            if len(stage) == 1:
+                await getattr(self, stage[0])()
+            else:
+                await asyncio.gather(*(getattr(self, step)() for step in stage))
+
+    def _stages(self) -> List[Tuple[str, ...]]:
+        """
+        단계 목록을 순서대로 실행될 묶음으로 나눕니다.
+        base_operation 단계는 항상 혼자 실행되는 경계가 되고, 경계 사이에서
+        연속으로 독립 선언된 단계들은 하나의 묶음이 됩니다.
+        """
+
+        stages: List[Tuple[str, ...]] = []
+        pending: List[str] = []
+        for step in TEMPLATE_STEPS:
+            if step in self.independent_steps and not step.startswith("base_"):
+                pending.append(step)
+                continue
+            if pending:
+                stages.append(tuple(pending))
+                pending = []
+            stages.append((step,))
+        if pending:
+            stages.append(tuple(pending))
+        return stages
+
+    # 이러한 작업에는 이미 구현이 있습니다.
+
+    async def base_operation1(self) -> None:
+        print("AsyncAbstractClass가 말합니다: 작업의 대부분을 수행 중입니다")
+
+    async def base_operation2(self) -> None:
+        print("AsyncAbstractClass가 말합니다: 하지만 몇몇 작업을 하위 클래스에게 위임합니다")
+
+    async def base_operation3(self) -> None:
+        print("AsyncAbstractClass가 말합니다: 하지만 작업의 대부분을 수행 중입니다")
+
+    # 이러한 작업은 하위 클래스에서 구현되어야 합니다.
+
+    @abstractmethod
+    async def required_operations1(self) -> None:
+        pass
+
+    @abstractmethod
+    async def required_operations2(self) -> None:
+        pass
+
+    # 이것들은 "훅"입니다. 하위 클래스가 오버라이드 할 수 있지만, 필수는 아닙니다.
+
+    async def hook1(self) -> None:
+        pass
+
+    async def hook2(self) -> None:
+        pass
+
+
+class AsyncConcreteClass1(AsyncAbstractClass):
+    """
+    독립 단계를 선언하지 않은 구체 클래스는 동기 버전과 같은 순서로 실행됩니다.
+    """
+
+    async def required_operations1(self) -> None:
+        print("AsyncConcreteClass1이 말합니다: 작업1을 구현했습니다")
+
+    async def required_operations2(self) -> None:
+        print("AsyncConcreteClass1이 말합니다: 작업2를 구현했습니다")
+
+
+class AsyncConcreteClass2(AsyncAbstractClass):
+    """
+    hook1과 required_operations2는 I/O를 기다리는 서로 독립적인 작업이므로 동시에 실행됩니다.
+    """
+
+    independent_steps = frozenset({"hook1", "required_operations2"})
+
+    async def required_operations1(self) -> None:
+        print("AsyncConcreteClass2가 말합니다: 작업1을 구현했습니다")
+
+    async def required_operations2(self) -> None:
+        await asyncio.sleep(0.1)
+        print("AsyncConcreteClass2가 말합니다: 작업2를 구현했습니다")
+
+    async def hook1(self) -> None:
+        await asyncio.sleep(0.1)
+        print("AsyncConcreteClass2가 말합니다: 훅1을 오버라이드했습니다")
+
+
+async def client_code(abstract_class: AsyncAbstractClass) -> None:
+    """
+    클라이언트 코드는 템플릿 메서드를 await 하여 알고리즘을 실행합니다.
+    """
+
+    # ...
+    await abstract_class.template_method()
+    # ...
+
+
+if __name__ == "__main__":
+    print("동일한 클라이언트 코드는 다른 하위 클래스와 함께 작동할 수 있습니다:")
+    asyncio.run(client_code(AsyncConcreteClass1()))
+    print("")
+
+    print("독립 단계는 동시에 실행됩니다:")
+    asyncio.run(client_code(AsyncConcreteClass2()))
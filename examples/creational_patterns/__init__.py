@@ -0,0 +1,41 @@
+"""
+생성 패턴 예제들입니다. 아래의 이름들은 처음 사용할 때 해당 모듈을 불러옵니다.
+"""
+
+_EXPORTS = {
+    "AbstractFactory": "abstract_factory",
+    "ConcreteFactory1": "abstract_factory",
+    "ConcreteFactory2": "abstract_factory",
+    "AbstractProductA": "abstract_factory",
+    "AbstractProductB": "abstract_factory",
+    "Builder": "builder",
+    "ConcreteBuilder1": "builder",
+    "Director": "builder",
+    "Product1": "builder",
+    "Creator": "factory_method",
+    "ConcreteCreator1": "factory_method",
+    "ConcreteCreator2": "factory_method",
+    "Product": "factory_method",
+    "SomeComponent": "prototype",
+    "SelfReferencingEntity": "prototype",
+    "SingletonMeta": "singleton_threadsafe",
+    "Singleton": "singleton_threadsafe",
+    "PooledSingletonMeta": "singleton_pool",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    from importlib import import_module
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition, Lock, Thread, local
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+class _Lease:
+    """
+    스레드가 빌린 인스턴스를 담습니다. 스레드가 끝나 스레드 로컬 저장소가 정리되면
+    weakref.finalize에 의해 인스턴스가 자동으로 풀에 반납됩니다.
+    """
+
+    def __init__(self, pool: _Pool, instance: Any) -> None:
+        self.instance = instance
+        self.finalizer = weakref.finalize(self, pool.release, instance)
+
+
+class _Pool:
+    """
+    클래스 하나에 대한 인스턴스 풀입니다. 유휴 인스턴스는 최근에 반납된 것부터 다시 사용되므로
+    오래 쓰이지 않은 인스턴스가 자연스럽게 유휴 시간 제한에 걸려 정리됩니다.
+
+    빌려준 인스턴스는 빌린 곳의 수, 그리고 혼자 쓰도록 빌려주었는지와 함께 기록됩니다. 공유를 허용한 요청은
+    풀이 가득 찼을 때 기다리는 대신 공유 중인 인스턴스 가운데 빌린 곳이 가장 적은 것을 함께 사용하며,
+    인스턴스는 마지막으로 빌린 곳이 반납할 때 풀로 돌아갑니다. 혼자 쓰도록 빌려준 인스턴스는 공유되지 않으므로,
+    그런 인스턴스만 남아 있으면 공유 요청도 반납을 기다립니다.
+    """
+
+    def __init__(self, size: int, idle_timeout: Optional[float],
+                 health_check: Optional[Callable[[Any], bool]],
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.size = size
+        self.health_check = health_check
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._in_use: Dict[int, List[Any]] = {}
+        self._total = 0
+        self._cond = Condition(Lock())
+        self.local = local()
+
+        self.created = 0
+        self.evicted = 0
+        self.unhealthy = 0
+        self.waits = 0
+        self.shared = 0
+
+    def acquire(self, factory: Callable[[], Any],
+                timeout: Optional[float] = None, share: bool = False) -> Any:
+        """
+        유휴 인스턴스 중 건강한 것을 돌려주고, 없으면 풀의 크기 한도 안에서 새로 만듭니다.
+        한도에 도달했다면 share가 참일 때는 공유 중인 인스턴스를 함께 쓰고,
+        아니면 다른 곳에서 반납할 때까지 최대 timeout초 동안 기다립니다.
+        share가 거짓이면 돌려준 인스턴스는 반납될 때까지 공유되지 않습니다.
+        """
+
+        while True:
+            with self._cond:
+                self._evict_idle()
+                if self._idle:
+                    instance, _ = self._idle.pop()
+                elif self._total < self.size:
+                    self._total += 1
+                    instance = None
+                else:
+                    shared = [entry for entry in self._in_use.values()
+                              if not entry[2]] if share else []
+                    if shared:
+                        entry = min(shared, key=lambda entry: entry[1])
+                        entry[1] += 1
+                        self.shared += 1
+                        return entry[0]
+                    self.waits += 1
+                    if not self._cond.wait(timeout):
+                        raise TimeoutError(
+                            f"{timeout}초 안에 풀에서 인스턴스를 빌리지 못했습니다 "
+                            f"(풀 크기 {self.size}).")
+                    continue
+
+            if instance is None:
+                try:
+                    instance = factory()
+                except BaseException:
+                    self._discard(None)
+                    raise
+                self.created += 1
+            elif self.health_check is not None and not self.health_check(instance):
+                self.unhealthy += 1
+                self._discard(instance)
+                continue
+
+            with self._cond:
+                # [인스턴스, 빌린 곳의 수, 혼자 쓰는지 여부]
+                self._in_use[id(instance)] = [instance, 1, not share]
+                # 새 인스턴스를 기다리던 공유 요청이 있을 수 있습니다.
+                self._cond.notify_all()
+            return instance
+
+    def release(self, instance: Any) -> None:
+        """
+        빌린 곳 하나의 반납을 기록합니다. 마지막 반납이면 건강한 인스턴스는 유휴 목록으로 돌아가고,
+        건강하지 않은 인스턴스는 버려집니다.
+        """
+
+        with self._cond:
+            entry = self._in_use.get(id(instance))
+            if entry is not None:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del self._in_use[id(instance)]
+        if self.health_check is not None and not self.health_check(instance):
+            self.unhealthy += 1
+            self._discard(instance)
+            return
+        with self._cond:
+            self._evict_idle()
+            self._idle.append((instance, self._clock()))
+            self._cond.notify()
+
+    def _discard(self, instance: Any) -> None:
+        if instance is not None:
+            _close(instance)
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    def _evict_idle(self) -> None:
+        # self._cond를 잡은 상태에서 호출됩니다.
+        if self._idle_timeout is None:
+            return
+        deadline = self._clock() - self._idle_timeout
+        while self._idle and self._idle[0][1] < deadline:
+            instance, _ = self._idle.popleft()
+            self._total -= 1
+            self.evicted += 1
+            _close(instance)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "size": self.size,
+                "total": self._total,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "created": self.created,
+                "evicted": self.evicted,
+                "unhealthy": self.unhealthy,
+                "waits": self.waits,
+                "shared": self.shared,
+            }
+
+
+def _close(instance: Any) -> None:
+    close = getattr(instance, "close", None)
+    if callable(close):
+        close()
+
+
+class PooledSingletonMeta(type):
+    """
+    SingletonMeta의 풀 버전입니다. 클래스마다 하나의 인스턴스 대신 최대 `pool_size`개의 인스턴스를 관리합니다.
+
+    `Resource(...)` 호출 방식은 그대로입니다. 각 스레드는 처음 호출할 때 풀에서 인스턴스를 하나 빌리고,
+    이후의 호출은 잠금 없이 스레드 로컬에 보관된 같은 인스턴스를 돌려받습니다. 풀이 가득 차 있으면
+    기다리지 않고 다른 스레드가 쓰고 있는 인스턴스를 함께 사용합니다. 다만 checkout()으로 빌린 인스턴스는
+    공유하지 않으므로, 모든 인스턴스가 checkout() 중이면 그중 하나가 반납될 때까지 기다립니다. 빌린 인스턴스는 `Resource.checkin()`을 호출하거나 스레드가 끝나면
+    풀로 돌아갑니다. 인스턴스를 혼자 써야 할 때는 `with Resource.checkout(timeout=...) as resource:`를
+    사용합니다. 이미 인스턴스를 빌린 스레드에서는 그 인스턴스가 그대로 사용됩니다.
+
+    클래스에서 다음 속성으로 동작을 조정합니다.
+
+    - `pool_size`: 풀의 최대 인스턴스 수 (기본값 4). 인스턴스는 필요할 때만 만들어집니다.
+    - `pool_idle_timeout`: 이 시간(초)보다 오래 쓰이지 않은 유휴 인스턴스는 빌리거나 반납할 때 정리됩니다.
+      None이면 정리하지 않습니다.
+    - `is_healthy()`: 정의되어 있으면 빌려주기 전, 반납할 때, 그리고 스레드 로컬 인스턴스를 돌려주기 전에
+      호출되며, False를 돌려준 인스턴스는 버려집니다.
+
+    정리되거나 버려진 인스턴스에 `close()` 메서드가 있으면 호출됩니다.
+    SingletonMeta와 마찬가지로 `__init__` 인수는 새 인스턴스를 만들 때만 사용됩니다.
+    """
+
+    _pools: Dict[type, _Pool] = {}
+
+    _lock: Lock = Lock()
+
+    def _pool(cls) -> _Pool:
+        pool = PooledSingletonMeta._pools.get(cls)
+        if pool is None:
+            with PooledSingletonMeta._lock:
+                pool = PooledSingletonMeta._pools.get(cls)
+                if pool is None:
+                    health_check = getattr(cls, "is_healthy", None)
+                    pool = _Pool(
+                        size=getattr(cls, "pool_size", 4),
+                        idle_timeout=getattr(cls, "pool_idle_timeout", None),
+                        health_check=health_check,
+                    )
+                    PooledSingletonMeta._pools[cls] = pool
+        return pool
+
+    def __call__(cls, *args, **kwargs):
+        pool = PooledSingletonMeta._pools.get(cls) or cls._pool()
+        lease = getattr(pool.local, "lease", None)
+        if lease is not None:
+            if pool.health_check is None or pool.health_check(lease.instance):
+                return lease.instance
+            del pool.local.lease
+            lease.finalizer()
+
+        instance = pool.acquire(
+            lambda: super(PooledSingletonMeta, cls).__call__(*args, **kwargs),
+            share=True)
+        pool.local.lease = _Lease(pool, instance)
+        return instance
+
+    def checkin(cls) -> None:
+        """
+        현재 스레드가 빌린 인스턴스를 풀에 반납합니다.
+        """
+
+        pool = cls._pool()
+        lease = getattr(pool.local, "lease", None)
+        if lease is not None:
+            del pool.local.lease
+            lease.finalizer()
+
+    @contextmanager
+    def checkout(cls, *args, timeout: Optional[float] = None,
+                 **kwargs) -> Iterator[Any]:
+        """
+        인스턴스 하나를 혼자 쓰도록 빌리고, 블록이 끝나면 반납합니다. 풀이 가득 차 있으면 최대 timeout초
+        동안 기다린 뒤 TimeoutError를 던집니다. 현재 스레드가 이미 빌린 인스턴스가 있으면 그것을 사용합니다.
+        """
+
+        pool = cls._pool()
+        lease = getattr(pool.local, "lease", None)
+        if lease is not None:
+            yield lease.instance
+            return
+
+        instance = pool.acquire(
+            lambda: super(PooledSingletonMeta, cls).__call__(*args, **kwargs),
+            timeout)
+        try:
+            yield instance
+        finally:
+            pool.release(instance)
+
+    def pool_stats(cls) -> Dict[str, int]:
+        return cls._pool().stats()
+
+
+class FakeConnection(metaclass=PooledSingletonMeta):
+    """
+    비싼 외부 자원을 흉내 내는 프로세스 내 가짜 연결입니다.
+    """
+
+    pool_size = 2
+    pool_idle_timeout = 30.0
+
+    def __init__(self, dsn: str) -> None:
+        self.dsn = dsn
+        self.closed = False
+        self.queries = 0
+
+    def is_healthy(self) -> bool:
+        return not self.closed
+
+    def query(self, sql: str) -> str:
+        self.queries += 1
+        return f"{self.dsn}: {sql} ({id(self):x})"
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_pooled_singleton(dsn: str) -> None:
+    connection = FakeConnection(dsn)
+    assert connection is FakeConnection(dsn)
+    print(connection.query("SELECT 1"))
+    FakeConnection.checkin()
+
+
+if __name__ == "__main__":
+    # 클라이언트 코드.
+
+    print("스레드 4개가 크기 2인 풀을 나누어 씁니다. 연결 id는 최대 2개만 보여야 합니다.\n")
+
+    threads = [Thread(target=test_pooled_singleton, args=("memory://fake",))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with FakeConnection.checkout("memory://fake") as connection:
+        connection.close()
+    print(f"\n닫힌 연결은 반납할 때 버려집니다: {FakeConnection('memory://fake').closed}")
+    print(FakeConnection.pool_stats())
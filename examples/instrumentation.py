@@ -0,0 +1,250 @@
+"""
+패턴 객체들을 관찰하기 위한 공용 계측 모듈입니다.
+
+계측은 선택 사항입니다. instrument_hierarchy()로 클래스 계층에 훅을 설치하면 해당 클래스와
+모든 하위 클래스(이후에 정의되는 하위 클래스 포함)의 메서드 호출 횟수, 소요 시간, 객체 생성 횟수가
+스레드별 버퍼에 기록되고, snapshot()을 호출할 때 합쳐집니다.
+
+설치할 때 원래 함수를 기록해 두며, 래퍼는 enable()을 호출해야 클래스에 적용됩니다. disable()은 원래 함수를
+되돌려 놓으므로 계측이 꺼져 있을 때는 호출 경로에 추가 비용이 없습니다.
+
+    from examples import instrumentation
+    instrumentation.install()
+    instrumentation.enable()
+    ...
+    print(instrumentation.snapshot())
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+import weakref
+from collections import defaultdict
+from threading import RLock, local
+from types import FunctionType
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class _Config:
+    enabled = False
+
+
+_config = _Config()
+
+# 스레드가 끝날 때 실행되는 정리 함수가 같은 스레드에서 잠금을 다시 잡을 수 있으므로 RLock을 사용합니다.
+_buffers_lock = RLock()
+_buffers: List[Dict[str, List[float]]] = []
+_retired: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+_thread_state = local()
+
+_WRAPPED = "__instrumented__"
+
+# (클래스, 속성 이름) -> (원래 함수, 래퍼). 원래 함수가 None이면 계측을 위해 추가한 `__init__`입니다.
+_installed: Dict[Tuple[type, str], Tuple[Optional[Callable], Callable]] = {}
+
+
+def enable() -> None:
+    _config.enabled = True
+    for (cls, attr), (_, wrapper) in list(_installed.items()):
+        setattr(cls, attr, wrapper)
+
+
+def disable() -> None:
+    _config.enabled = False
+    for (cls, attr), (original, _) in list(_installed.items()):
+        if original is None:
+            delattr(cls, attr)
+        else:
+            setattr(cls, attr, original)
+
+
+def _patch(cls: type, attr: str, original: Optional[Callable],
+           wrapper: Callable) -> None:
+    _installed[cls, attr] = (original, wrapper)
+    if _config.enabled:
+        setattr(cls, attr, wrapper)
+
+
+class _ThreadBuffer:
+    """
+    스레드 로컬 저장소에 보관되는 버퍼의 소유자입니다. 스레드가 끝나 이 객체가 사라지면
+    버퍼의 값이 _retired에 합쳐지고 버퍼 목록에서 제거됩니다.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+        with _buffers_lock:
+            _buffers.append(self.counts)
+        weakref.finalize(self, _retire, self.counts)
+
+
+def _retire(counts: Dict[str, List[float]]) -> None:
+    with _buffers_lock:
+        for name, (calls, total) in list(counts.items()):
+            _retired[name][0] += calls
+            _retired[name][1] += total
+        # list.remove()는 ==로 비교하므로, reset() 뒤의 빈 버퍼들을 구분하도록 동일성으로 찾습니다.
+        for index, buffer in enumerate(_buffers):
+            if buffer is counts:
+                del _buffers[index]
+                break
+
+
+def _buffer() -> Dict[str, List[float]]:
+    """
+    현재 스레드의 버퍼를 돌려줍니다. 버퍼의 값은 [호출 횟수, 누적 소요 시간(초)]입니다.
+    """
+
+    try:
+        return _thread_state.buffer.counts
+    except AttributeError:
+        _thread_state.buffer = _ThreadBuffer()
+        return _thread_state.buffer.counts
+
+
+def _record(name: str, elapsed: float) -> None:
+    entry = _buffer()[name]
+    entry[0] += 1
+    entry[1] += elapsed
+
+
+def snapshot(reset: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    모든 스레드의 버퍼를 합쳐 `{이름: {"calls": ..., "total_s": ...}}` 형태로 돌려줍니다.
+    객체 생성은 `<클래스>.__init__` 항목으로 집계됩니다.
+    """
+
+    merged: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+    with _buffers_lock:
+        for buffer in [_retired, *_buffers]:
+            for name, (calls, total) in list(buffer.items()):
+                merged[name][0] += calls
+                merged[name][1] += total
+            if reset:
+                buffer.clear()
+    return {name: {"calls": calls, "total_s": total}
+            for name, (calls, total) in sorted(merged.items())}
+
+
+def reset() -> None:
+    snapshot(reset=True)
+
+
+def instrumented(name: str) -> Callable[[Callable], Callable]:
+    """
+    함수를 계측하는 데코레이터입니다.
+    """
+
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _config.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, time.perf_counter() - start)
+
+        setattr(wrapper, _WRAPPED, True)
+        return wrapper
+
+    return decorate
+
+
+def _instrument_init(cls: type) -> None:
+    """
+    `__init__`을 감싸 객체 생성을 기록합니다. 하위 클래스가 super()로 호출한 경우는 기록하지 않으므로
+    `<클래스>.__init__` 항목의 호출 횟수가 곧 그 클래스의 객체 생성 횟수가 됩니다.
+    클래스에 `__init__`이 없으면 상위 클래스로 그대로 위임하는 `__init__`을 추가합니다.
+    """
+
+    if (cls, "__init__") in _installed:
+        return
+    original = init = vars(cls).get("__init__")
+    if init is None:
+        def init(self, *args, **kwargs):
+            super(cls, self).__init__(*args, **kwargs)
+
+    name = f"{cls.__name__}.__init__"
+
+    @functools.wraps(init)
+    def __init__(self, *args, **kwargs):
+        if not _config.enabled or type(self) is not cls:
+            return init(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return init(self, *args, **kwargs)
+        finally:
+            _record(name, time.perf_counter() - start)
+
+    setattr(__init__, _WRAPPED, True)
+    _patch(cls, "__init__", original, __init__)
+
+
+def _instrument_class(cls: type) -> None:
+    """
+    클래스에 직접 정의된 공개 메서드와 `__init__`을 감쌉니다. 이미 감싼 메서드는 건너뜁니다.
+    """
+
+    _instrument_init(cls)
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not isinstance(value, FunctionType):
+            continue
+        if getattr(value, _WRAPPED, False) or (cls, attr) in _installed:
+            continue
+        _patch(cls, attr, value, instrumented(f"{cls.__name__}.{attr}")(value))
+
+
+def instrument_hierarchy(base: type) -> type:
+    """
+    base와 현재의 모든 하위 클래스를 계측하고, 이후 정의되는 하위 클래스도 자동으로 계측되도록
+    `__init_subclass__` 훅을 설치합니다. 클래스 데코레이터로도 사용할 수 있습니다.
+    """
+
+    if vars(base).get("__instrumented_base__"):
+        return base
+
+    pending = [base]
+    while pending:
+        cls = pending.pop()
+        _instrument_class(cls)
+        pending.extend(cls.__subclasses__())
+
+    previous = base.__dict__.get("__init_subclass__")
+
+    def __init_subclass__(cls, **kwargs):
+        if previous is not None:
+            previous.__get__(None, cls)(**kwargs)
+        else:
+            super(base, cls).__init_subclass__(**kwargs)
+        _instrument_class(cls)
+
+    base.__init_subclass__ = classmethod(__init_subclass__)
+    base.__instrumented_base__ = True
+    return base
+
+
+_HIERARCHIES: Tuple[Tuple[str, str], ...] = (
+    ("examples.behavioral_patterns.command", "Command"),
+    ("examples.behavioral_patterns.template_method", "AbstractClass"),
+    ("examples.creational_patterns.factory_method", "Creator"),
+    ("examples.creational_patterns.abstract_factory", "AbstractFactory"),
+    ("examples.creational_patterns.builder", "Builder"),
+    ("examples.structural_patterns.composite", "Component"),
+    ("examples.structural_patterns.bridge", "Implementation"),
+)
+
+
+def install() -> None:
+    """
+    Command, AbstractClass, Creator, AbstractFactory, Builder, Component, Implementation
+    계층에 계측 훅을 설치합니다. 계측은 enable()을 호출해야 기록되기 시작합니다.
+    """
+
+    import importlib
+
+    for module_name, class_name in _HIERARCHIES:
+        module = importlib.import_module(module_name)
+        instrument_hierarchy(getattr(module, class_name))
@@ -0,0 +1,41 @@
+"""
+구조 패턴 예제들입니다. 아래의 이름들은 처음 사용할 때 해당 모듈을 불러옵니다.
+"""
+
+_EXPORTS = {
+    "Target": "adapter",
+    "Adaptee": "adapter",
+    "Adapter": "adapter",
+    "translate_many": "adapter",
+    "AsyncAdapter": "adapter_async",
+    "CachingAdapter": "adapter_cache",
+    "TranslationCache": "adapter_cache",
+    "Abstraction": "bridge",
+    "ExtendedAbstraction": "bridge",
+    "RoutingAbstraction": "bridge",
+    "Implementation": "bridge",
+    "ConcreteImplementationA": "bridge",
+    "ConcreteImplementationB": "bridge",
+    "Component": "composite",
+    "Leaf": "composite",
+    "Composite": "composite",
+    "PersistentComposite": "composite_concurrent",
+    "ConcurrentTree": "composite_concurrent",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    from importlib import import_module
+
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
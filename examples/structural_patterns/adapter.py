@@ -1,3 +1,6 @@
+from typing import Iterable, List
+
+
 class Target:
     """
     Target은 클라이언트 코드에서 사용하는 도메인별 인터페이스를 정의합니다.
@@ -23,7 +26,83 @@ class Adapter(Target, Adaptee):
     """
 
     def request(self) -> str:
-        return f"Adapter: (번역됨) {self.specific_request()[::-1]}"
+        return translate(self.specific_request())
+
+    def request_many(self, n: int) -> List[str]:
+        """
+        request()를 n번 호출한 것과 같은 결과를 한 번의 일괄 번역으로 만듭니다.
+        """
+
+        return translate_all([self.specific_request() for _ in range(n)])
+
+
+_PREFIX = "Adapter: (번역됨) "
+_SEPARATOR = "\n"
+
+
+def translate(text: str) -> str:
+    """
+    Adaptee가 돌려준 문자열 하나를 Target의 형식으로 번역합니다.
+    """
+
+    return f"{_PREFIX}{text[::-1]}"
+
+
+def translate_all(raw: List[str]) -> List[str]:
+    """
+    Adaptee가 돌려준 문자열들을 한꺼번에 번역합니다.
+
+    항목마다 슬라이스와 f-문자열을 만드는 대신, 뒤집힌 접두사와 구분자로 모든 항목을 이어 붙인
+    하나의 버퍼를 한 번에 뒤집고 다시 나눕니다. 뒤집힌 접두사는 다시 뒤집히면서 제자리로 돌아오고,
+    전체를 뒤집으면 항목의 순서도 뒤집히므로 나눈 뒤 목록의 순서만 되돌리면 됩니다.
+    결과 문자열은 항목마다 하나씩 만들어지므로 할당량은 translate()를 반복 호출할 때와 같고,
+    줄어드는 것은 항목별 호출과 포매팅 비용뿐입니다.
+    구분자가 포함된 항목이 있으면 항목별 번역으로 돌아갑니다.
+    """
+
+    if not raw:
+        return []
+    glue = _PREFIX[::-1] + _SEPARATOR
+    joined = glue.join(raw) + _PREFIX[::-1]
+    if joined.count(_SEPARATOR) != len(raw) - 1:
+        return [translate(text) for text in raw]
+    translated = joined[::-1].split(_SEPARATOR)
+    translated.reverse()
+    return translated
+
+
+def translate_many(adaptees: Iterable[Adaptee]) -> List[str]:
+    """
+    여러 Adaptee의 결과를 일괄 번역합니다.
+    """
+
+    return translate_all([adaptee.specific_request() for adaptee in adaptees])
+
+
+def translate_buffer(data: bytes, separator: bytes = b"\n") -> bytes:
+    """
+    이미 바이트로 받은 (예를 들어 소켓이나 파일에서 읽은) 구분자 단위의 레코드들을
+    문자열로 디코딩하지 않고 번역합니다. 각 레코드는 translate()와 같은 결과를 UTF-8로 인코딩한 값이 되며,
+    레코드의 순서는 유지됩니다. data가 구분자로 끝나면 그 구분자는 마지막 레코드의 끝으로 보고
+    결과의 끝에도 그대로 붙이며, 빈 레코드를 만들지 않습니다.
+
+    멀티바이트 문자를 깨뜨리지 않도록 ASCII 데이터만 받습니다.
+    """
+
+    if not data.isascii():
+        raise ValueError("translate_buffer는 ASCII 데이터만 처리합니다.")
+    if not separator:
+        raise ValueError("구분자는 비어 있을 수 없습니다.")
+    if not data:
+        return b""
+    terminator = separator if data.endswith(separator) else b""
+    if terminator:
+        data = data[:-len(terminator)]
+    prefix = _PREFIX.encode("utf-8")
+    # 뒤집힌 데이터에서는 구분자도 뒤집혀 있으므로 뒤집힌 구분자로 나눕니다.
+    reversed_records = bytes(memoryview(data)[::-1]).split(separator[::-1])
+    reversed_records.reverse()
+    return prefix + (separator + prefix).join(reversed_records) + terminator
 
 
 def client_code(target: "Target") -> None:
@@ -48,3 +127,8 @@ if __name__ == "__main__":
     print("클라이언트: 하지만 Adapter를 통해 작업할 수 있어요:")
     adapter = Adapter()
     client_code(adapter)
+    print("\n")
+
+    print("클라이언트: 여러 요청을 한 번에 번역할 수도 있어요:")
+    for translated in adapter.request_many(3):
+        print(translated)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from examples.structural_patterns.adapter import Adaptee, translate
+
+
+class AsyncAdapter:
+    """
+    AsyncAdapter는 블로킹 Adaptee를 asyncio 인터페이스로 감쌉니다.
+
+    Adaptee 호출은 크기가 제한된 스레드 풀에서 실행되므로 이벤트 루프가 멈추지 않습니다.
+    동시에 진행되는 호출 수는 max_concurrency로 제한되며, 그 이상의 요청은 자리가 날 때까지
+    await 상태로 기다립니다. 이렇게 호출자에게 배압(back-pressure)이 전달됩니다.
+
+    asyncio.Semaphore는 처음 사용된 이벤트 루프에 묶이므로 이벤트 루프마다 따로 만듭니다.
+    따라서 같은 어댑터를 여러 asyncio.run()에서 사용할 수 있습니다.
+    """
+
+    def __init__(self, adaptee: Adaptee, max_concurrency: int = 4,
+                 executor: Optional[ThreadPoolExecutor] = None) -> None:
+        self._adaptee = adaptee
+        self._max_concurrency = max_concurrency
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="adaptee")
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+        self.pending = 0
+
+    def _semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self._max_concurrency)
+        return semaphore
+
+    async def request(self) -> str:
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        try:
+            async with self._semaphore(loop):
+                result = await loop.run_in_executor(
+                    self._executor, self._adaptee.specific_request)
+        finally:
+            self.pending -= 1
+        return translate(result)
+
+    def close(self) -> None:
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> AsyncAdapter:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # 진행 중인 호출이 끝나기를 기다리는 동안 이벤트 루프가 멈추지 않도록 다른 스레드에서 종료합니다.
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+async def client_code(adapter: AsyncAdapter) -> None:
+    """
+    클라이언트 코드는 이벤트 루프를 막지 않고 여러 요청을 동시에 보낼 수 있습니다.
+    """
+
+    results = await asyncio.gather(*(adapter.request() for _ in range(8)))
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    """
+    python -m examples.structural_patterns.adapter_async
+    """
+
+    class BlockingAdaptee(Adaptee):
+        """
+        블로킹 방식으로 동작하는 레거시 인터페이스를 흉내 냅니다.
+        """
+
+        def specific_request(self) -> str:
+            time.sleep(0.1)
+            return super().specific_request()
+
+    async def main() -> None:
+        async with AsyncAdapter(BlockingAdaptee(), max_concurrency=4) as adapter:
+            start = time.perf_counter()
+            await client_code(adapter)
+            print(f"8개의 요청을 동시 호출 4개로 처리: "
+                  f"{time.perf_counter() - start:.2f}초")
+
+    asyncio.run(main())
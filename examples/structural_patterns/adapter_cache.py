@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from examples.structural_patterns.adapter import Adaptee, Target, translate
+
+
+class _InFlight:
+    """
+    같은 키에 대해 진행 중인 하나의 로드를 나타냅니다. 다른 스레드는 이 객체를 기다립니다.
+    """
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TranslationCache:
+    """
+    TTL과 LRU 제한이 있는 캐시입니다. 여러 어댑터가 하나의 캐시를 공유할 수 있습니다.
+
+    같은 키에 대한 동시 호출은 하나의 로드로 합쳐집니다. 처음 도착한 스레드만 로더를 호출하고,
+    나머지는 그 결과를 기다려 함께 사용합니다.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._in_flight: Dict[Hashable, _InFlight] = {}
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.load_count = 0
+        self.load_time = 0.0
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires >= self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            self.misses += 1
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self._in_flight[key] = _InFlight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+
+        start = time.perf_counter()
+        try:
+            in_flight.value = loader()
+        except BaseException as error:
+            in_flight.error = error
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                del self._in_flight[key]
+                self.load_count += 1
+                self.load_time += elapsed
+                if in_flight.error is None:
+                    self._store(key, in_flight.value)
+            in_flight.done.set()
+        return in_flight.value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        expires = float("inf") if self._ttl is None else self._clock() + self._ttl
+        self._entries[key] = (expires, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        적중/실패 횟수와 실제 로드에 걸린 평균 지연 시간(초)을 돌려줍니다.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "loads": self.load_count,
+                "avg_load_latency": (self.load_time / self.load_count
+                                     if self.load_count else 0.0),
+                "size": len(self._entries),
+            }
+
+
+class CachingAdapter(Target):
+    """
+    CachingAdapter는 Adaptee를 감싸고 번역 결과를 캐시에 보관합니다.
+    반복되는 번역은 사전 조회 한 번으로 끝납니다. 기본 번역은 Adapter.request()와 같은 translate()입니다.
+
+    key는 같은 결과를 돌려주는 Adaptee들을 구분하는 값입니다. 기본값은 Adaptee 객체 자체입니다.
+    """
+
+    def __init__(self, adaptee: Adaptee,
+                 translate: Callable[[str], str] = translate,
+                 cache: Optional[TranslationCache] = None,
+                 key: Optional[Hashable] = None) -> None:
+        self._adaptee = adaptee
+        self._translate = translate
+        self.cache = cache if cache is not None else TranslationCache()
+        self._key = key if key is not None else adaptee
+
+    def _load(self) -> str:
+        return self._translate(self._adaptee.specific_request())
+
+    def request(self) -> str:
+        return self.cache.get(self._key, self._load)
+
+
+def client_code(target: Target) -> None:
+    """
+    클라이언트 코드는 Target 인터페이스를 따르는 모든 클래스를 지원합니다.
+    """
+
+    print(target.request())
+
+
+if __name__ == "__main__":
+    """
+    python -m examples.structural_patterns.adapter_cache
+    """
+
+    from threading import Thread
+
+    class SlowAdaptee(Adaptee):
+        """
+        느린 레거시 인터페이스를 흉내 냅니다.
+        """
+
+        def specific_request(self) -> str:
+            time.sleep(0.05)
+            return super().specific_request()
+
+    adapter = CachingAdapter(SlowAdaptee(), cache=TranslationCache(maxsize=16, ttl=60))
+
+    print("클라이언트: 동시에 요청해도 느린 Adaptee는 한 번만 호출됩니다:")
+    threads = [Thread(target=client_code, args=(adapter,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print("\n클라이언트: 반복 요청은 캐시에서 처리됩니다:")
+    client_code(adapter)
+    print(adapter.cache.stats())
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
+from itertools import chain
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 class Abstraction:
@@ -16,6 +20,15 @@ class Abstraction:
         return (f"Abstraction: 기본 작업:\n"
                 f"{self.implementation.operation_implementation()}")
 
+    def operation_many(self, items: Sequence) -> List[str]:
+        """
+        여러 요청을 한 번의 operation_implementation_batch 호출로 처리합니다.
+        """
+
+        prefix = "Abstraction: 기본 작업:\n"
+        results = self.implementation.operation_implementation_batch(items)
+        return [prefix + result for result in results]
+
 
 class ExtendedAbstraction(Abstraction):
     """
@@ -26,6 +39,137 @@ class ExtendedAbstraction(Abstraction):
         return (f"ExtendedAbstraction: 확장된 작업:\n"
                 f"{self.implementation.operation_implementation()}")
 
+    def operation_many(self, items: Sequence) -> List[str]:
+        prefix = "ExtendedAbstraction: 확장된 작업:\n"
+        results = self.implementation.operation_implementation_batch(items)
+        return [prefix + result for result in results]
+
+
+class RoutingAbstraction(Abstraction):
+    """
+    RoutingAbstraction은 여러 Implementation을 보유하고, 각 작업을 최근 지연 시간이 가장 짧은 구현에 보냅니다.
+    지연 시간은 지수 가중 이동 평균(EWMA)으로 추적합니다.
+
+    구현 목록과 지연 시간 사전은 (목록, 사전) 튜플 하나로 보관되며, 목록을 바꿀 때는 새 튜플을 만들어
+    참조를 한 번에 바꿉니다. 따라서 읽기 경로에는 잠금이 없고, 작업은 항상 교체 전이나 교체 후의
+    완전한 목록 중 하나를 봅니다. 교체 전에 시작된 작업은 이전 사전에 기록하므로, 제거된 구현이
+    새 사전에 다시 나타나지 않습니다.
+
+    구현이 예외를 던지면 그 구현은 무한대 지연 시간으로 기록되고, 같은 작업은 다음으로 빠른 구현에서
+    다시 시도됩니다. 모든 구현이 실패했을 때만 마지막 예외가 호출자에게 전달됩니다.
+    """
+
+    def __init__(self, implementations: Iterable[Implementation],
+                 alpha: float = 0.2, probe_every: int = 100) -> None:
+        self._write_lock = Lock()
+        self._state: Tuple[Tuple[Implementation, ...], Dict[Implementation, float]] = (
+            tuple(implementations), {})
+        self._alpha = alpha
+        self._probe_every = probe_every
+        self._calls = 0
+
+    @property
+    def implementation(self) -> Implementation:
+        """
+        다음 작업이 사용할 구현입니다. 아직 측정되지 않은 구현이 먼저 선택되며,
+        probe_every번마다 한 번씩은 차례대로 다른 구현을 시도해 지연 시간 정보를 갱신합니다.
+        """
+
+        return self._choose(*self._state)
+
+    @implementation.setter
+    def implementation(self, implementation: Implementation) -> None:
+        self.swap([implementation])
+
+    @property
+    def implementations(self) -> Tuple[Implementation, ...]:
+        return self._state[0]
+
+    def swap(self, implementations: Iterable[Implementation]) -> None:
+        """
+        구현 목록 전체를 원자적으로 교체합니다. 진행 중인 작업은 이전 구현으로 끝납니다.
+        """
+
+        routes = tuple(implementations)
+        with self._write_lock:
+            self._replace(routes)
+
+    def add(self, implementation: Implementation) -> None:
+        with self._write_lock:
+            routes, latency = self._state
+            self._state = (routes + (implementation,), latency)
+
+    def remove(self, implementation: Implementation) -> None:
+        with self._write_lock:
+            self._replace(tuple(route for route in self._state[0]
+                                if route is not implementation))
+
+    def _replace(self, routes: Tuple[Implementation, ...]) -> None:
+        # self._write_lock을 잡은 상태에서 호출됩니다. 남는 구현의 지연 시간만 새 사전으로 옮깁니다.
+        latency = self._state[1]
+        self._state = (routes, {route: latency[route]
+                                for route in routes if route in latency})
+
+    def latencies(self) -> Dict[Implementation, float]:
+        return dict(self._state[1])
+
+    def _choose(self, routes: Tuple[Implementation, ...],
+                latency: Dict[Implementation, float]) -> Implementation:
+        if not routes:
+            raise LookupError("라우팅할 Implementation이 없습니다.")
+        self._calls += 1
+        if self._calls % self._probe_every == 0:
+            return routes[(self._calls // self._probe_every) % len(routes)]
+        return min(routes, key=lambda route: latency.get(route, 0.0))
+
+    def _dispatch(self, call: Callable[[Implementation], Any], count: int = 1) -> Any:
+        """
+        선택된 구현으로 call을 실행하고, 실패하면 남은 구현을 지연 시간 순서대로 시도합니다.
+        성공한 구현에는 항목당 지연 시간을 기록합니다.
+        """
+
+        routes, latency = self._state
+        first = self._choose(routes, latency)
+        fallbacks = (route for route in sorted(routes, key=lambda route: latency.get(route, 0.0))
+                     if route is not first)
+        error: Optional[Exception] = None
+        for route in chain((first,), fallbacks):
+            start = time.perf_counter()
+            try:
+                result = call(route)
+            except Exception as exc:
+                latency[route] = float("inf")
+                error = exc
+                continue
+            self._record(latency, route, (time.perf_counter() - start) / count)
+            return result
+        raise error
+
+    def _record(self, latency: Dict[Implementation, float],
+                route: Implementation, elapsed: float) -> None:
+        previous = latency.get(route)
+        if previous is None or previous == float("inf"):
+            latency[route] = elapsed
+        else:
+            latency[route] = (self._alpha * elapsed
+                              + (1 - self._alpha) * previous)
+
+    def operation(self) -> str:
+        result = self._dispatch(lambda route: route.operation_implementation())
+        return f"RoutingAbstraction: 라우팅된 작업:\n{result}"
+
+    def operation_many(self, items: Sequence) -> List[str]:
+        """
+        배치 전체를 하나의 구현으로 보내고, 항목당 평균 지연 시간을 기록합니다.
+        """
+
+        if not items:
+            return []
+        results = self._dispatch(
+            lambda route: route.operation_implementation_batch(items), len(items))
+        prefix = "RoutingAbstraction: 라우팅된 작업:\n"
+        return [prefix + result for result in results]
+
 
 class Implementation(ABC):
     """
@@ -38,6 +182,15 @@ class Implementation(ABC):
     def operation_implementation(self) -> str:
         pass
 
+    def operation_implementation_batch(self, items: Sequence) -> List[str]:
+        """
+        items의 각 항목에 대해 하나씩 결과를 돌려줍니다.
+        기본 구현은 operation_implementation을 반복 호출하며, 한 번에 일괄 처리할 수 있는
+        (예를 들어 NumPy 기반의) 구현은 이 메서드를 오버라이드하면 됩니다.
+        """
+
+        return [self.operation_implementation() for _ in items]
+
 
 """
 각 구체적인 Implementation은 특정 플랫폼에 해당하며, 해당 플랫폼의 API를 사용하여 Implementation 인터페이스를 구현합니다.
@@ -48,6 +201,10 @@ class ConcreteImplementationA(Implementation):
     def operation_implementation(self) -> str:
         return "ConcreteImplementationA: 플랫폼 A에서의 결과입니다."
 
+    def operation_implementation_batch(self, items: Sequence) -> List[str]:
+        # 플랫폼 A의 결과는 요청마다 같으므로 문자열을 한 번만 만들어 공유합니다.
+        return [self.operation_implementation()] * len(items)
+
 
 class ConcreteImplementationB(Implementation):
     def operation_implementation(self) -> str:
@@ -82,3 +239,14 @@ if __name__ == "__main__":
     implementation = ConcreteImplementationB()
     abstraction = ExtendedAbstraction(implementation)
     client_code(abstraction)
+
+    print("\n")
+
+    abstraction = RoutingAbstraction(
+        [ConcreteImplementationA(), ConcreteImplementationB()])
+    client_code(abstraction)
+
+    print("\n")
+
+    abstraction = ExtendedAbstraction(ConcreteImplementationB())
+    print("\n".join(abstraction.operation_many(range(2))), end="")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
 
 
 class Component(ABC):
@@ -9,6 +11,8 @@ class Component(ABC):
     베이스 Component 클래스는 구성의 간단한 객체와 복합 객체 모두에 대한 공통 작업을 선언합니다.
     """
 
+    _fold_cache: Optional[Dict[Tuple[Callable, Callable], Any]] = None
+
     @property
     def parent(self) -> Component:
         return self._parent
@@ -50,6 +54,56 @@ class Component(ABC):
 
         pass
 
+    def fold(self, leaf: Callable[[Component], T],
+             branch: Callable[[Component, List[T]], T],
+             cache: bool = False) -> T:
+        """
+        트리를 한 번 순회하며 값을 집계합니다. 잎에는 leaf(잎)을, 복합 객체에는 자식들의 결과 목록과 함께
+        branch(복합 객체, 결과들)을 적용합니다. operation()과 달리 문자열을 만들지 않으므로
+        노드 수, 합계, 깊이 같은 수치를 계산하는 데 적합합니다.
+
+        cache가 참이면 복합 객체마다 결과를 (leaf, branch) 쌍을 키로 저장합니다. 저장된 결과는
+        cache 값과 관계없이 이후 같은 함수 객체로 집계할 때 재사용되며, 자식이 추가되거나 제거되면
+        해당 복합 객체와 그 조상들의 저장된 결과는 지워집니다.
+        재귀 대신 명시적인 스택을 사용하므로 깊은 트리도 처리할 수 있습니다.
+        """
+
+        key = (leaf, branch)
+        values: List[T] = []
+        stack: List[Tuple[Component, Optional[int]]] = [(self, None)]
+        while stack:
+            node, child_count = stack.pop()
+            if child_count is None:
+                cached = node._fold_cache
+                if cached is not None and key in cached:
+                    values.append(cached[key])
+                elif not node.is_composite():
+                    values.append(leaf(node))
+                else:
+                    children = node._children
+                    stack.append((node, len(children)))
+                    stack.extend((child, None) for child in reversed(children))
+                continue
+
+            if child_count:
+                results = values[-child_count:]
+                del values[-child_count:]
+            else:
+                results = []
+            value = branch(node, results)
+            if cache:
+                if node._fold_cache is None:
+                    node._fold_cache = {}
+                node._fold_cache[key] = value
+            values.append(value)
+        return values[0]
+
+    def _invalidate_fold_cache(self) -> None:
+        node: Optional[Component] = self
+        while node is not None and node._fold_cache:
+            node._fold_cache = None
+            node = getattr(node, "_parent", None)
+
 
 class Leaf(Component):
     """
@@ -78,10 +132,12 @@ class Composite(Component):
     def add(self, component: Component) -> None:
         self._children.append(component)
         component.parent = self
+        self._invalidate_fold_cache()
 
     def remove(self, component: Component) -> None:
         self._children.remove(component)
         component.parent = None
+        self._invalidate_fold_cache()
 
     def is_composite(self) -> bool:
         return True
@@ -145,3 +201,20 @@ if __name__ == "__main__":
 
     print("Client: 객체를 관리할 때 구성 요소 클래스를 확인할 필요가 없습니다:")
     client_code2(tree, simple)
+    print("\n")
+
+    # fold는 문자열을 만들지 않고 트리 전체를 집계합니다.
+    def count_leaf(leaf: Component) -> int:
+        return 1
+
+    def count_branch(branch: Component, counts: List[int]) -> int:
+        return sum(counts)
+
+    def depth_leaf(leaf: Component) -> int:
+        return 1
+
+    def depth_branch(branch: Component, depths: List[int]) -> int:
+        return 1 + max(depths, default=0)
+
+    print(f"Client: 잎의 수는 {tree.fold(count_leaf, count_branch)}개, "
+          f"깊이는 {tree.fold(depth_leaf, depth_branch)}입니다.")
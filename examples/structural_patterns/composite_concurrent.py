@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+from examples.structural_patterns.composite import Component, Composite, Leaf
+
+
+class PersistentComposite(Component):
+    """
+    PersistentComposite는 만들어진 뒤 바뀌지 않는 복합 구성 요소입니다. 자식은 튜플로 보관됩니다.
+
+    자식을 바꾸는 메서드는 자신을 수정하는 대신 새 노드를 돌려주며, 바뀌지 않은 자식들은 새 노드와 공유됩니다.
+    여러 버전의 트리가 노드를 공유하므로 부모 참조는 설정하지 않습니다.
+    """
+
+    def __init__(self, children: Iterable[Component] = ()) -> None:
+        self._children: Tuple[Component, ...] = tuple(children)
+
+    @property
+    def children(self) -> Tuple[Component, ...]:
+        return self._children
+
+    def add(self, component: Component) -> None:
+        raise TypeError("PersistentComposite는 수정할 수 없습니다. with_child()를 사용하세요.")
+
+    def remove(self, component: Component) -> None:
+        raise TypeError("PersistentComposite는 수정할 수 없습니다. without_child()를 사용하세요.")
+
+    def is_composite(self) -> bool:
+        return True
+
+    def with_child(self, component: Component) -> PersistentComposite:
+        return PersistentComposite(self._children + (component,))
+
+    def without_child(self, index: int) -> PersistentComposite:
+        children = list(self._children)
+        del children[index]
+        return PersistentComposite(children)
+
+    def with_child_at(self, index: int, component: Component) -> PersistentComposite:
+        children = list(self._children)
+        children[index] = component
+        return PersistentComposite(children)
+
+    def operation(self) -> str:
+        results = []
+        for child in self._children:
+            results.append(child.operation())
+        return f"Branch({'+'.join(results)})"
+
+
+def freeze(component: Component) -> Component:
+    """
+    일반 Composite 트리를 같은 모양의 PersistentComposite 트리로 바꿉니다.
+    Leaf는 상태가 없으므로 그대로 공유됩니다.
+    """
+
+    if not component.is_composite():
+        return component
+    frozen: List[Component] = []
+    stack: List[Tuple[Component, Optional[int]]] = [(component, None)]
+    while stack:
+        node, child_count = stack.pop()
+        if child_count is None:
+            if not node.is_composite():
+                frozen.append(node)
+                continue
+            children = node._children
+            stack.append((node, len(children)))
+            stack.extend((child, None) for child in reversed(children))
+        else:
+            children = frozen[len(frozen) - child_count:]
+            del frozen[len(frozen) - child_count:]
+            frozen.append(PersistentComposite(children))
+    return frozen[0]
+
+
+class ConcurrentTree:
+    """
+    ConcurrentTree는 동시에 읽고 쓸 수 있는 Component 트리입니다.
+
+    읽는 쪽은 snapshot()으로 현재 루트를 잠금 없이 얻습니다. 루트는 불변이므로 읽는 도중 다른 스레드가
+    트리를 수정해도 스냅숏은 바뀌지 않으며, 수정이 절반만 반영된 트리를 보는 일도 없습니다.
+
+    쓰는 쪽은 잠금을 잡고, 수정할 노드부터 루트까지의 경로에 있는 노드만 새로 만든 뒤(경로 복사)
+    (버전, 루트) 참조를 한 번의 대입으로 교체해 새 버전을 공개합니다.
+
+    CPython에서는 GIL 때문에 순수 Python 코드인 operation()이 여러 스레드에서 동시에 실행되지는 않지만,
+    읽기 경로에 잠금이 없으므로 읽는 스레드끼리, 또는 쓰는 스레드와 서로 기다리지 않습니다.
+    """
+
+    def __init__(self, root: Optional[Component] = None) -> None:
+        frozen = freeze(root) if root is not None else PersistentComposite()
+        if not frozen.is_composite():
+            raise TypeError("ConcurrentTree의 루트는 복합 구성 요소여야 합니다.")
+        self._current: Tuple[int, PersistentComposite] = (0, frozen)
+        self._write_lock = Lock()
+
+    def snapshot(self) -> PersistentComposite:
+        return self._current[1]
+
+    @property
+    def version(self) -> int:
+        return self._current[0]
+
+    def operation(self) -> str:
+        return self.snapshot().operation()
+
+    def update(self, path: Sequence[int],
+               change: Callable[[PersistentComposite], PersistentComposite]) -> int:
+        """
+        루트에서 path의 자식 인덱스들을 따라 내려간 복합 노드에 change를 적용하고 새 버전 번호를 돌려줍니다.
+        """
+
+        with self._write_lock:
+            version, root = self._current
+            nodes = [root]
+            for index in path:
+                child = nodes[-1].children[index]
+                if not isinstance(child, PersistentComposite):
+                    raise TypeError(f"경로 {tuple(path)}가 복합 구성 요소를 가리키지 않습니다.")
+                nodes.append(child)
+
+            replacement = change(nodes.pop())
+            for index in reversed(path):
+                replacement = nodes.pop().with_child_at(index, replacement)
+
+            self._current = (version + 1, replacement)
+            return version + 1
+
+    def add(self, path: Sequence[int], component: Component) -> int:
+        return self.update(path, lambda node: node.with_child(freeze(component)))
+
+    def remove(self, path: Sequence[int], index: int) -> int:
+        return self.update(path, lambda node: node.without_child(index))
+
+
+if __name__ == "__main__":
+    """
+    python -m examples.structural_patterns.composite_concurrent
+    """
+
+    from threading import Thread
+
+    branch = Composite()
+    branch.add(Leaf())
+    tree = ConcurrentTree()
+    tree.add([], branch)
+
+    before = tree.snapshot()
+
+    def writer() -> None:
+        for _ in range(1_000):
+            tree.add([0], Leaf())
+            tree.remove([0], 0)
+
+    def reader() -> None:
+        for _ in range(1_000):
+            # 스냅숏은 항상 완전한 버전 하나이므로 잎의 수는 1 또는 2입니다.
+            leaves = tree.snapshot().operation().count("Leaf")
+            assert leaves in (1, 2), leaves
+
+    threads = [Thread(target=writer)] + [Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(f"이전 스냅숏: {before.operation()}")
+    print(f"현재 버전 {tree.version}: {tree.operation()}")
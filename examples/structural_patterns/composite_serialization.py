@@ -0,0 +1,255 @@
+"""
+Component 트리를 압축된 바이너리 형식으로 저장하고 불러옵니다.
+
+파일은 헤더 뒤에 세 개의 배열이 전위 순회(preorder) 순서로 이어진 구조입니다.
+
+    헤더          magic(4) 버전(1) 바이트 순서(1) 예약(2) 노드 수(8)
+    kinds         노드마다 1바이트 (0 = Leaf, 1 = Composite), 4바이트 경계까지 채움
+    child_counts  노드마다 uint32, 자식 수
+    sizes         노드마다 uint32, 자신을 포함한 서브트리의 노드 수
+
+전위 순회에서 노드 i의 첫 자식은 i + 1이고, 자식 c의 다음 형제는 c + sizes[c]입니다.
+따라서 load()는 파일을 mmap으로 열기만 하고, 방문한 서브트리의 노드만 필요할 때 객체로 만듭니다.
+load()가 돌려주는 MappedTree는 컨텍스트 관리자이며, 블록이 끝나면 mmap이 닫힙니다.
+
+    with load(path) as tree:
+        print(tree.root.operation())
+트리의 모양만 저장되며, Leaf와 Composite 이외의 상태는 저장되지 않습니다.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import BinaryIO, List, Optional, Union
+
+from examples.structural_patterns.composite import Component, Composite, Leaf
+
+_MAGIC = b"CMPT"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBxxQ")
+_LEAF = 0
+_COMPOSITE = 1
+_BYTEORDER = {"little": 0, "big": 1}
+
+
+def _padded(length: int) -> int:
+    return (length + 3) & ~3
+
+
+def dump(component: Component, file: Union[str, BinaryIO]) -> int:
+    """
+    component를 루트로 하는 트리를 file에 저장하고 노드 수를 돌려줍니다.
+    재귀를 사용하지 않으므로 깊은 트리도 저장할 수 있습니다.
+    """
+
+    kinds = bytearray()
+    child_counts = array("I")
+    parents = array("q")
+
+    stack = [(component, -1)]
+    while stack:
+        node, parent = stack.pop()
+        index = len(kinds)
+        parents.append(parent)
+        if node.is_composite():
+            children = node._children
+            kinds.append(_COMPOSITE)
+            child_counts.append(len(children))
+            stack.extend((child, index) for child in reversed(children))
+        else:
+            kinds.append(_LEAF)
+            child_counts.append(0)
+
+    count = len(kinds)
+    sizes = array("I", [1]) * count
+    for index in range(count - 1, 0, -1):
+        sizes[parents[index]] += sizes[index]
+    del parents
+
+    kinds.extend(b"\0" * (_padded(count) - count))
+    header = _HEADER.pack(_MAGIC, _VERSION, _BYTEORDER[sys.byteorder], count)
+
+    if isinstance(file, str):
+        with open(file, "wb") as handle:
+            return _write(handle, header, kinds, child_counts, sizes, count)
+    return _write(file, header, kinds, child_counts, sizes, count)
+
+
+def _write(handle: BinaryIO, header: bytes, kinds: bytearray,
+           child_counts: array, sizes: array, count: int) -> int:
+    handle.write(header)
+    handle.write(kinds)
+    handle.write(memoryview(child_counts).cast("B"))
+    handle.write(memoryview(sizes).cast("B"))
+    return count
+
+
+class MappedTree:
+    """
+    mmap으로 연 트리 파일입니다. 배열은 파일 위의 memoryview이므로 불러오는 데 드는 비용은
+    노드 수와 관계없이 일정합니다. 다 쓴 뒤에는 close()를 호출하거나 with 문으로 사용합니다.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            count = self._validate(path)
+        except BaseException:
+            self._mmap.close()
+            raise
+
+        view = memoryview(self._mmap)
+        offset = _HEADER.size
+        self.count = count
+        self.kinds = view[offset:offset + count]
+        offset += _padded(count)
+        self.child_counts = view[offset:offset + 4 * count].cast("I")
+        offset += 4 * count
+        self.sizes = view[offset:offset + 4 * count].cast("I")
+        self._root: Optional[Component] = None
+        self.closed = False
+
+    def _validate(self, path: str) -> int:
+        """
+        헤더와 파일 길이를 확인하고 노드 수를 돌려줍니다.
+        """
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{path}는 Component 트리 파일이 아닙니다.")
+        magic, version, byteorder, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path}는 Component 트리 파일이 아닙니다.")
+        if byteorder != _BYTEORDER[sys.byteorder]:
+            raise ValueError(f"{path}는 바이트 순서가 다른 시스템에서 저장되었습니다.")
+        if len(self._mmap) < _HEADER.size + _padded(count) + 8 * count:
+            raise ValueError(f"{path}가 잘려 있습니다: 노드 {count}개를 담기에 짧습니다.")
+        return count
+
+    @property
+    def root(self) -> Component:
+        """
+        루트 노드입니다. 처음 접근할 때 만들어지며, 이후에는 같은 객체를 돌려줍니다.
+        """
+
+        if self._root is None:
+            self._root = self.node(0)
+        return self._root
+
+    def node(self, index: int, parent: Optional[Component] = None) -> Component:
+        if self.kinds[index] == _COMPOSITE:
+            node: Component = LazyComposite(self, index)
+        else:
+            node = Leaf()
+        node.parent = parent
+        return node
+
+    def children(self, index: int, parent: Component) -> List[Component]:
+        if self.closed:
+            raise ValueError("닫힌 트리 파일에서는 서브트리를 만들 수 없습니다.")
+        sizes = self.sizes
+        child = index + 1
+        children = []
+        for _ in range(self.child_counts[index]):
+            children.append(self.node(child, parent))
+            child += sizes[child]
+        return children
+
+    def close(self) -> None:
+        """
+        mmap을 닫습니다. 이미 만들어진 노드는 그대로 쓸 수 있지만, 아직 방문하지 않은 서브트리는
+        더 이상 만들 수 없습니다. 여러 번 호출해도 됩니다.
+        """
+
+        if self.closed:
+            return
+        self.closed = True
+        self.kinds.release()
+        self.child_counts.release()
+        self.sizes.release()
+        self._mmap.close()
+
+    def __enter__(self) -> MappedTree:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LazyComposite(Composite):
+    """
+    자식 목록을 처음 사용할 때 파일에서 만드는 Composite입니다.
+    일단 만들어진 뒤에는 일반 Composite와 똑같이 동작하며, add/remove도 사용할 수 있습니다.
+    """
+
+    def __init__(self, tree: MappedTree, index: int) -> None:
+        self._tree = tree
+        self._index = index
+        self._loaded: Optional[List[Component]] = None
+
+    @property
+    def _children(self) -> List[Component]:
+        if self._loaded is None:
+            self._loaded = self._tree.children(self._index, self)
+        return self._loaded
+
+    @_children.setter
+    def _children(self, children: List[Component]) -> None:
+        self._loaded = children
+
+    @property
+    def subtree_size(self) -> int:
+        """
+        파일에 저장된 서브트리의 노드 수입니다. 자식을 만들지 않고도 알 수 있습니다.
+        """
+
+        return self._tree.sizes[self._index]
+
+
+def load(path: str) -> MappedTree:
+    """
+    path의 트리를 mmap으로 열어 돌려줍니다. 루트는 MappedTree.root이며, 자식들은 방문할 때 만들어집니다.
+    """
+
+    return MappedTree(path)
+
+
+if __name__ == "__main__":
+    """
+    python -m examples.structural_patterns.composite_serialization
+    """
+
+    import os
+    import tempfile
+    import time
+
+    tree = Composite()
+    for _ in range(1_000):
+        branch = Composite()
+        for _ in range(1_000):
+            branch.add(Leaf())
+        tree.add(branch)
+
+    path = os.path.join(tempfile.mkdtemp(), "tree.cmpt")
+    start = time.perf_counter()
+    count = dump(tree, path)
+    print(f"노드 {count:,}개를 저장했습니다: {os.path.getsize(path):,} 바이트, "
+          f"{time.perf_counter() - start:.2f}초")
+
+    start = time.perf_counter()
+    with load(path) as loaded:
+        root = loaded.root
+        print(f"트리를 열었습니다(노드 {root.subtree_size:,}개): "
+              f"{(time.perf_counter() - start) * 1e6:.0f}us")
+
+    branch = Composite()
+    branch.add(Leaf())
+    small = Composite()
+    small.add(Leaf())
+    small.add(branch)
+    dump(small, path)
+    with load(path) as loaded:
+        print(f"RESULT: {loaded.root.operation()}")